@@ -4,15 +4,22 @@ from creditpy.adjusted_herfindahl_hirschman_index import Adjusted_Herfindahl_Hir
 from creditpy.anchor_point import Anchor_point
 from creditpy.bayesian_calibration import bayesian_calibration
 from creditpy.binomial_test import Binomial_test
+from creditpy.bootstrap_gini import bootstrap_gini
 from creditpy.calculate_gini import calculate_gini
 from creditpy.chisquare_test import chisquare_test
+from creditpy.compare_gini import compare_gini
+from creditpy.correlation_matrix import correlation_matrix
 from creditpy.correlation_cluster import correlation_cluster
+from creditpy.correlation_pruning import correlation_pruning
+from creditpy.discrimination_report import discrimination_report
+from creditpy.feature_screening import feature_screening
 from creditpy.gini_elimination import Gini_elimination
 from creditpy.gini_univariate import Gini_univariate
 from creditpy.gini_univariate_data import Gini_univariate_data
 from creditpy.herfindahl_hirschman_index import Herfindahl_Hirschman_Index
 from creditpy.iv_calc import IV_calc
 from creditpy.iv_calc_data import IV_calc_data
+from creditpy.iv_calc_engine import IV_calc_engine
 from creditpy.iv_elimination import IV_elimination
 from creditpy.kfold_cross_validation_glm import k_fold_cross_validation_glm
 from creditpy.kolmogorov_smirnov import Kolmogorov_Smirnov
@@ -22,10 +29,18 @@ from creditpy.missing_elimination import missing_elimination
 from creditpy.missing_ratio import missing_ratio
 from creditpy.na_checker import na_checker
 from creditpy.na_filler_contvar import na_filler_contvar
+from creditpy.parallel_backend import parallel_map, column_block_apply
 from creditpy.psi_calc_data import PSI_calc_data
+from creditpy.psi_monitor import PSIBaseline, PSIAccumulator
+from creditpy.quantile_sketch import QuantileSketch
+from creditpy.rank_auc import rank_auc
 from creditpy.regression_calibration import regression_calibration
+from creditpy.rolling_gini_tracker import RollingGiniTracker
 from creditpy.scaled_score import scaled_score
+from creditpy.scoring_pipeline import ScoringPipeline
 from creditpy.ssi_calc_data import SSI_calc_data
+from creditpy.stats_cache import StatsCache
+from creditpy.streaming_auc import StreamingAUC
 from creditpy.summary_default_flag import summary_default_flag
 from creditpy.time_series_gini import time_series_gini_roc
 from creditpy.train_test_balanced_split import train_test_balanced_split
@@ -33,8 +48,12 @@ from creditpy.train_test_split import train_test_split
 from creditpy.variable_clustering import variable_clustering
 from creditpy.variable_clustering_gini import variable_clustering_gini
 from creditpy.vif_calc import vif_calc
+from creditpy.vif_elimination import vif_elimination
+from creditpy.walk_forward_validation_glm import walk_forward_validation_glm
 from creditpy.woe import woe_binning
+from creditpy.woe_binning_chunked import woe_binning_chunked
 from creditpy.woe_glm_feature_importance import woe_glm_feature_importance
+from creditpy.woe_transformer import WoeTransformer
 from creditpy.load_german_credit_data import load_german_credit_data
 # List of all the modules, classes, and functions to be exported
 __all__ = [
@@ -43,15 +62,22 @@ __all__ = [
     'Anchor_point',
     'bayesian_calibration',
     'Binomial_test',
+    'bootstrap_gini',
     'calculate_gini',
     'chisquare_test',
+    'compare_gini',
+    'correlation_matrix',
+    'discrimination_report',
+    'feature_screening',
     'correlation_cluster',
+    'correlation_pruning',
     'Gini_elimination',
     'Gini_univariate',
     'Gini_univariate_data',
     'Herfindahl_Hirschman_Index',
     'IV_calc',
     'IV_calc_data',
+    'IV_calc_engine',
     'IV_elimination',
     'k_fold_cross_validation_glm',
     'Kolmogorov_Smirnov',
@@ -61,10 +87,20 @@ __all__ = [
     'missing_ratio',
     'na_checker',
     'na_filler_contvar',
+    'parallel_map',
+    'column_block_apply',
     'PSI_calc_data',
+    'PSIBaseline',
+    'PSIAccumulator',
+    'QuantileSketch',
+    'rank_auc',
     'regression_calibration',
+    'RollingGiniTracker',
     'scaled_score',
+    'ScoringPipeline',
     'SSI_calc_data',
+    'StatsCache',
+    'StreamingAUC',
     'summary_default_flag',
     'time_series_gini_roc',
     'train_test_balanced_split',
@@ -72,7 +108,11 @@ __all__ = [
     'variable_clustering',
     'variable_clustering_gini',
     'vif_calc',
+    'vif_elimination',
+    'walk_forward_validation_glm',
     'woe_binning',
+    'woe_binning_chunked',
     'woe_glm_feature_importance',
+    'WoeTransformer',
     'load_german_credit_data'
 ]
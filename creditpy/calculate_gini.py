@@ -1,6 +1,8 @@
 from sklearn.metrics import roc_auc_score
+from creditpy.streaming_auc import _streaming_result
 
-def calculate_gini(predictions, actual):
+def calculate_gini(predictions, actual, method="exact", bins=10000, score_range=(0.0, 1.0), grid="fixed",
+                   chunksize=1000000, return_error_bound=False):
     """
     Calculate Gini coefficient for a model using ROC curve.
 
@@ -9,15 +11,39 @@ def calculate_gini(predictions, actual):
         Predicted values from the model.
     actual : array-like
         Actual values from the test data.
+    method : str, optional
+        "exact" for roc_auc_score, or "histogram" for the approximate AUC of StreamingAUC, which counts the
+        predictions into a grid of bins in one linear pass with O(bins) memory. Default is "exact".
+    bins : int, optional
+        The number of bins of the histogram method. Default is 10000.
+    score_range : tuple, optional
+        The range of the fixed grid of the histogram method. Default is (0, 1).
+    grid : str, optional
+        "fixed" or "adaptive" grid of the histogram method. See StreamingAUC. Default is "fixed".
+    chunksize : int, optional
+        The number of predictions counted at a time by the histogram method. Default is 1000000.
+    return_error_bound : bool, optional
+        Also return the guaranteed error bound of the Gini, which is 0 for the exact method. Default is False.
 
     Returns:
     float:
-        Gini coefficient value.
+        Gini coefficient value, for both methods.
+        If return_error_bound is True, a tuple of the Gini and its error bound.
     """
+    if method == "histogram":
+        result = _streaming_result(predictions, actual, bins, score_range, grid, chunksize)
+        if return_error_bound:
+            return result["Gini"], result["Gini Error Bound"]
+        return result["Gini"]
+    if method != "exact":
+        raise ValueError(f"Unknown method '{method}'. Use 'exact' or 'histogram'.")
+
     # Calculate the Area Under the ROC Curve (AUC)
     auc = roc_auc_score(actual, predictions)
 
     # Calculate Gini coefficient from AUC
     gini_coefficient = (2 * auc) - 1
 
-    return gini_coefficient
\ No newline at end of file
+    if return_error_bound:
+        return gini_coefficient, 0.0
+    return gini_coefficient
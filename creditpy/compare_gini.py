@@ -0,0 +1,107 @@
+import pandas as pd
+import numpy as np
+from scipy.stats import norm
+from creditpy.rank_auc import _binary_target
+
+
+def compare_gini(scores_a, scores_b, actual):
+    """
+    Test whether the Gini coefficients of a champion and one or more challengers on the same sample differ,
+    with DeLong's test.
+
+    The AUC covariance matrix is estimated with the midrank formulation of DeLong's method, which needs
+    one sort per model, O(n log n), instead of comparing every pair of events and non-events.
+
+    Parameters:
+    scores_a : array-like
+        Predicted values of the champion model. Higher values indicate a higher probability of default.
+    scores_b : array-like, DataFrame or list of array-like
+        Predicted values of one challenger, or of several challengers as the columns of a DataFrame or
+        2-D array or as a list.
+    actual : array-like
+        Actual values of the sample. The greater of the two classes is taken as the default.
+        Observations with a missing actual value or score in any model are left out.
+
+    Returns:
+    dict
+        A dictionary containing:
+        - 'comparison': Gini of every challenger, its difference from the champion, the z-statistic and
+          the two-sided p-value.
+        - 'covariance': The covariance matrix of the AUCs, champion first.
+        - 'champion_gini': Gini of the champion.
+
+    Examples:
+    >>> result = compare_gini(test['PD_champion'], test[['PD_challenger_1', 'PD_challenger_2']],
+    ...                       test['creditability'])
+    >>> result['comparison']
+    """
+    if isinstance(scores_b, pd.DataFrame):
+        names = list(scores_b.columns)
+        challengers = [scores_b[column].to_numpy(dtype=float) for column in names]
+    elif isinstance(scores_b, list):
+        challengers = [np.asarray(scores, dtype=float) for scores in scores_b]
+        names = [f"Challenger {k + 1}" for k in range(len(challengers))]
+    elif isinstance(scores_b, pd.Series):
+        challengers = [scores_b.to_numpy(dtype=float)]
+        names = [scores_b.name if scores_b.name is not None else "Challenger"]
+    else:
+        scores_b = np.asarray(scores_b, dtype=float)
+        challengers = [scores_b] if scores_b.ndim == 1 else list(scores_b.T)
+        names = ["Challenger"] if scores_b.ndim == 1 else [f"Challenger {k + 1}" for k in range(len(challengers))]
+
+    scores = np.vstack([np.asarray(scores_a, dtype=float)] + challengers)
+    target = _binary_target(actual)
+    valid = ~np.isnan(target) & ~np.isnan(scores).any(axis=0)
+    scores = scores[:, valid]
+    target = target[valid]
+
+    positive = scores[:, target == 1]
+    negative = scores[:, target == 0]
+    m = positive.shape[1]
+    n = negative.shape[1]
+    if m < 2 or n < 2:
+        raise ValueError("At least two events and two non-events are needed for DeLong's test.")
+
+    # Midranks within the events, within the non-events and in the pooled sample
+    pooled_ranks = _midranks(np.hstack([positive, negative]))
+    positive_ranks = _midranks(positive)
+    negative_ranks = _midranks(negative)
+
+    # Structural components: share of non-events below every event and of events above every non-event
+    v10 = (pooled_ranks[:, :m] - positive_ranks) / n
+    v01 = 1 - (pooled_ranks[:, m:] - negative_ranks) / m
+    auc = v10.mean(axis=1)
+    covariance = np.atleast_2d(np.cov(v10)) / m + np.atleast_2d(np.cov(v01)) / n
+
+    variance = covariance[0, 0] + np.diag(covariance)[1:] - 2 * covariance[0, 1:]
+    difference = auc[1:] - auc[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = difference / np.sqrt(variance)
+    p_value = 2 * norm.sf(np.abs(z))
+
+    comparison = pd.DataFrame({
+        'Model': names,
+        'Gini': 2 * auc[1:] - 1,
+        'Gini.Difference': 2 * difference,
+        'Z': z,
+        'P.Value': p_value
+    })
+    labels = ["Champion"] + names
+    return {
+        'comparison': comparison,
+        'covariance': pd.DataFrame(covariance, index=labels, columns=labels),
+        'champion_gini': 2 * auc[0] - 1
+    }
+
+
+def _midranks(values):
+    # Midranks (1-based, ties averaged) of every row of a 2-D array
+    order = np.argsort(values, axis=1, kind='mergesort')
+    ranks = np.empty(values.shape)
+    n = values.shape[1]
+    for k in range(values.shape[0]):
+        sorted_values = values[k, order[k]]
+        start = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+        end = np.r_[start[1:], n]
+        ranks[k, order[k]] = np.repeat((start + end + 1) / 2, end - start)
+    return ranks
@@ -1,49 +1,114 @@
 import pandas as pd
 import numpy as np
+from creditpy.correlation_matrix import correlation_matrix
 
 
-def correlation_cluster(data, clustering_data, clusters, target_column):
+def correlation_cluster(data, clustering_data, clusters, target_column, variable_column="Variable", method="pearson",
+                        chunksize=100000, return_variables=False):
     """
     Average Correlations of Clusters
 
     This function calculates correlations for clusters using the output of a clustering function.
 
+    The correlation matrix of all clustered variables is computed once with correlation_matrix, from running sums
+    over row chunks, and every measure is taken from blocks of that matrix.
+
     Parameters:
-    data : pandas DataFrame
-        A raw data set.
+    data : pandas DataFrame, str, callable or list of DataFrame
+        A raw data set, or a CSV or Parquet file or chunk source as accepted by correlation_matrix.
     clustering_data : pandas DataFrame
         Output of the clustering function.
     clusters : str
         The column name of "clusters" in the clustering function output.
     target_column : str
         The name of the target column to exclude from correlation calculations.
+    variable_column : str, optional
+        The column name of the variables in the clustering function output. Default is "Variable".
+    method : str, optional
+        "pearson" or "spearman". Default is "pearson".
+    chunksize : int, optional
+        The number of rows per chunk of the correlation matrix. Default is 100000.
+    return_variables : bool, optional
+        Also return the VARCLUS-style R-squared of every variable. Default is False.
 
     Returns:
     pandas DataFrame
-        A DataFrame containing average correlations for each cluster.
+        A DataFrame containing average correlations for each cluster, and the nearest cluster with the average
+        correlation between the two clusters' variables. With return_variables=True, a dictionary with this
+        DataFrame as 'cluster_summary' and as 'variable_summary' the squared correlation of every variable with
+        the first principal component of its own cluster (RS_Own) and of the nearest other cluster (RS_NC), and
+        the 1 - R-squared ratio (RS_Ratio).
 
     Examples:
     correlation_cluster(my_data, clustering_output, "Groups", "target_column")
     """
-    cluster_values = sorted(clustering_data[clusters].unique())
-    cluster_correlations = []
+    members = clustering_data[clustering_data[variable_column] != target_column]
+    variables = list(members[variable_column])
+    groups = members[clusters].to_numpy()
+    cluster_values = sorted(members[clusters].unique())
+    positions = {cluster: np.flatnonzero(groups == cluster) for cluster in cluster_values}
 
-    for cluster in cluster_values:
-        # Filter data based on cluster
-        cluster_indices = clustering_data[clustering_data[clusters] == cluster].index
-        cluster_data = data.loc[cluster_indices]
+    correlation = correlation_matrix(data, columns=variables, chunksize=chunksize, method=method).to_numpy()
 
-        # Drop target column
-        cluster_data = cluster_data.drop(columns=[target_column])
+    # Average correlation of every pair of clusters from the blocks of the matrix; the diagonal is excluded
+    off_diagonal = correlation.copy()
+    np.fill_diagonal(off_diagonal, np.nan)
+    n_clusters = len(cluster_values)
+    block_means = np.full((n_clusters, n_clusters), np.nan)
+    with np.errstate(invalid='ignore'):
+        for a, cluster_a in enumerate(cluster_values):
+            for b, cluster_b in enumerate(cluster_values):
+                block = off_diagonal[np.ix_(positions[cluster_a], positions[cluster_b])]
+                if np.any(~np.isnan(block)):
+                    block_means[a, b] = np.nanmean(block)
 
-        # Calculate correlations
-        correlations = cluster_data.corr().values
-        np.fill_diagonal(correlations, np.nan)  # Exclude diagonal values
-        cluster_correlations.append(np.nanmean(correlations))
+    nearest = []
+    nearest_correlation = []
+    for a in range(n_clusters):
+        others = np.abs(block_means[a]).copy()
+        others[a] = np.nan
+        if np.all(np.isnan(others)):
+            nearest.append(np.nan)
+            nearest_correlation.append(np.nan)
+        else:
+            b = int(np.nanargmax(others))
+            nearest.append(cluster_values[b])
+            nearest_correlation.append(block_means[a, b])
 
     cor_summary = pd.DataFrame({
         'Clusters': cluster_values,
-        'Correlation': cluster_correlations
+        'Correlation': np.diag(block_means),
+        'Nearest.Cluster': nearest,
+        'Nearest.Correlation': nearest_correlation
     })
+    if not return_variables:
+        return cor_summary
+
+    # Correlation of every variable with the first principal component of every cluster:
+    # corr(x_i, PC) = R[i, C] @ v / sqrt(lambda), with (lambda, v) the largest eigenpair of R[C, C]
+    filled = np.nan_to_num(correlation)
+    component_correlation = np.zeros((len(variables), n_clusters))
+    for a, cluster in enumerate(cluster_values):
+        index = positions[cluster]
+        eigenvalues, eigenvectors = np.linalg.eigh(filled[np.ix_(index, index)])
+        if eigenvalues[-1] > 0:
+            component_correlation[:, a] = filled[:, index] @ eigenvectors[:, -1] / np.sqrt(eigenvalues[-1])
+
+    squared = component_correlation ** 2
+    own = np.array([cluster_values.index(group) for group in groups])
+    rs_own = squared[np.arange(len(variables)), own]
+    squared[np.arange(len(variables)), own] = -np.inf
+    rs_nc = squared.max(axis=1) if n_clusters > 1 else np.zeros(len(variables))
+    rs_nc = np.where(np.isinf(rs_nc), 0.0, rs_nc)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs_ratio = (1 - rs_own) / (1 - rs_nc)
+
+    variable_summary = pd.DataFrame({
+        'Clusters': groups,
+        'Variable': variables,
+        'RS_Own': rs_own,
+        'RS_NC': rs_nc,
+        'RS_Ratio': rs_ratio
+    }).sort_values(['Clusters', 'RS_Ratio'], ignore_index=True)
 
-    return cor_summary
+    return {'cluster_summary': cor_summary, 'variable_summary': variable_summary}
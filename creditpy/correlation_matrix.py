@@ -0,0 +1,78 @@
+import pandas as pd
+import numpy as np
+from creditpy.woe_binning_chunked import _iter_chunks
+
+
+def correlation_matrix(data, columns=None, chunksize=100000, method="pearson", file_format=None):
+    """
+    Calculate the correlation matrix of the numeric variables from running sums over row chunks.
+
+    The sums of the values, squares and cross-products over the rows where both variables are present are
+    accumulated chunk by chunk in float64 with matrix products, so memory grows with the number of variables and
+    not with the number of rows, and data which is read in chunks from a file does not have to fit in memory.
+    Missing values are handled pairwise, as in DataFrame.corr.
+
+    Parameters:
+    data : pandas DataFrame, str, callable or list of DataFrame
+        The dataset, or a CSV or Parquet file, a function returning an iterator of DataFrame chunks or a list
+        of chunks, as in woe_binning_chunked.
+    columns : list, optional
+        The variables. Default is all numeric columns.
+    chunksize : int, optional
+        The number of rows per chunk. Default is 100000.
+    method : str, optional
+        "pearson" or "spearman". The Spearman correlation is the Pearson correlation of the ranks of every
+        variable, which needs the data as a DataFrame. Default is "pearson".
+    file_format : str, optional
+        "csv" or "parquet" when data is a file. By default it is inferred from the file extension.
+
+    Returns:
+    pandas DataFrame
+        The correlation matrix. Pairs with a constant variable give NaN.
+
+    Examples:
+    correlation_matrix(train.drop(columns=['creditability']), chunksize=500000)
+    correlation_matrix('development_sample.csv', chunksize=1000000)
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"Unknown method '{method}'. Use 'pearson' or 'spearman'.")
+    if method == "spearman":
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError("The Spearman correlation needs the data as a DataFrame.")
+        if columns is None:
+            columns = list(data.select_dtypes(include=[np.number]).columns)
+        data = pd.DataFrame({column: data[column].rank() for column in columns})
+
+    count = sum_x = sum_xx = sum_xy = shift = None
+    for chunk in _iter_chunks(data, chunksize, file_format):
+        if columns is None:
+            columns = list(chunk.select_dtypes(include=[np.number]).columns)
+        values = chunk[columns].to_numpy(dtype=float)
+        if shift is None:
+            p = len(columns)
+            count, sum_x, sum_xx, sum_xy = (np.zeros((p, p)) for _ in range(4))
+            # Values are shifted by the means of the first chunk to keep the sums well conditioned
+            with np.errstate(invalid='ignore'):
+                shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else np.zeros(p)
+        present = ~np.isnan(values)
+        centred = np.where(present, values - shift, 0.0)
+        mask = present.astype(float)
+        count += mask.T @ mask
+        sum_x += centred.T @ mask  # sum of variable i over the rows where j is present
+        sum_xx += (centred ** 2).T @ mask
+        sum_xy += centred.T @ centred
+
+    if shift is None:
+        columns = [] if columns is None else list(columns)
+        return pd.DataFrame(np.full((len(columns), len(columns)), np.nan), index=columns, columns=columns)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = sum_xy - sum_x * sum_x.T / count
+        variance_x = sum_xx - sum_x ** 2 / count
+        correlation = covariance / np.sqrt(variance_x * variance_x.T)
+    correlation[(count < 2) | (variance_x <= 0) | (variance_x.T <= 0)] = np.nan
+    correlation = np.clip(correlation, -1, 1)
+    diagonal = np.diag(variance_x) > 0
+    correlation[np.diag_indices(len(columns))] = np.where(diagonal, 1.0, np.nan)
+
+    return pd.DataFrame(correlation, index=columns, columns=columns)
@@ -0,0 +1,141 @@
+import pandas as pd
+import numpy as np
+from scipy import sparse
+from creditpy.gini_univariate_data import Gini_univariate_data
+from creditpy.iv_calc_data import IV_calc_data
+
+
+def correlation_pruning(data, default_flag, threshold=0.8, criterion="gini", method="pearson", dtype="float32",
+                        block_size=500, n_jobs=1, backend=None, verbose=True):
+    """
+    Drop one variable of every highly correlated pair, keeping the variable with the higher univariate statistic.
+
+    The correlations are computed in column blocks, each block against the columns that follow it, and only the
+    pairs whose absolute correlation reaches the threshold are kept in a sparse matrix, so the dense correlation
+    matrix is never held in memory. The variables are then visited from the highest to the lowest univariate
+    Gini or IV: a variable is kept unless it is correlated with a variable which is already kept, in which case
+    it is dropped. Missing values are replaced by the mean of the variable in the correlations.
+
+    Parameters:
+    data : pandas DataFrame
+        The dataset.
+    default_flag : str
+        The name of the default flag variable.
+    threshold : float, optional
+        Pairs with an absolute correlation at or above this value are pruned. Default is 0.8.
+    criterion : str, optional
+        "gini" for the absolute rank Gini of Gini_univariate_data or "iv" for the IV of IV_calc_data.
+        Default is "gini".
+    method : str, optional
+        "pearson" or "spearman". The Spearman correlation is the Pearson correlation of the ranks.
+        Default is "pearson".
+    dtype : str, optional
+        "float32" or "float64", the precision of the standardized values and the block products.
+        Default is "float32".
+    block_size : int, optional
+        The number of columns per block. Default is 500.
+    n_jobs : int, optional
+        The number of workers of the univariate statistics. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+    verbose : bool, optional
+        Print every dropped variable. Default is True.
+
+    Returns:
+    dict
+        A dictionary containing:
+        - 'pruned_data': The dataset without the dropped variables.
+        - 'correlated_pairs': Every pair of variables at or above the threshold with its correlation.
+        - 'drop_list': Every dropped variable, the kept variable it is correlated with and their correlation.
+        - 'kept_variables': The kept variables.
+
+    Examples:
+    result = correlation_pruning(train, "creditability", threshold=0.75, criterion="iv")
+    result['drop_list']
+    """
+    if criterion not in ("gini", "iv"):
+        raise ValueError(f"Unknown criterion '{criterion}'. Use 'gini' or 'iv'.")
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"Unknown method '{method}'. Use 'pearson' or 'spearman'.")
+
+    variables = [column for column in data.select_dtypes(include=[np.number]).columns if column != default_flag]
+    values = _standardized_values(data[variables], method, np.dtype(dtype))
+    pairs = _correlated_pairs(values, threshold, block_size)
+
+    if criterion == "gini":
+        statistics = Gini_univariate_data(data[variables + [default_flag]], default_flag, method="rank",
+                                          n_jobs=n_jobs, backend=backend)
+        score = statistics.set_index('Variable')['Gini'].abs()
+    else:
+        statistics = IV_calc_data(data[variables + [default_flag]], default_flag, verbose=False,
+                                  n_jobs=n_jobs, backend=backend)
+        score = statistics.set_index('Variable')['IV']
+    score = score.reindex(variables).fillna(-np.inf).to_numpy()
+
+    # Greedy pass from the strongest variable: a variable correlated with a kept variable is dropped
+    adjacency = (pairs + pairs.T).tocsr()
+    kept = np.zeros(len(variables), dtype=bool)
+    dropped = np.zeros(len(variables), dtype=bool)
+    drop_list = []
+    for index in np.argsort(-score, kind='stable'):
+        if dropped[index]:
+            continue
+        kept[index] = True
+        neighbours = adjacency.indices[adjacency.indptr[index]:adjacency.indptr[index + 1]]
+        correlations = adjacency.data[adjacency.indptr[index]:adjacency.indptr[index + 1]]
+        for neighbour, correlation in zip(neighbours, correlations):
+            if not kept[neighbour] and not dropped[neighbour]:
+                dropped[neighbour] = True
+                drop_list.append([variables[neighbour], variables[index], correlation])
+                if verbose:
+                    print(f"Dropped: {variables[neighbour]}, correlated with {variables[index]}: {correlation}")
+
+    pairs = pairs.tocoo()
+    correlated_pairs = pd.DataFrame({
+        'Variable.1': [variables[i] for i in pairs.row],
+        'Variable.2': [variables[j] for j in pairs.col],
+        'Correlation': pairs.data
+    })
+    correlated_pairs = correlated_pairs.reindex(
+        correlated_pairs['Correlation'].abs().sort_values(ascending=False).index).reset_index(drop=True)
+
+    dropped_variables = [variable for variable, drop in zip(variables, dropped) if drop]
+    return {
+        'pruned_data': data.drop(columns=dropped_variables),
+        'correlated_pairs': correlated_pairs,
+        'drop_list': pd.DataFrame(drop_list, columns=['Variable', 'Kept.Variable', 'Correlation']),
+        'kept_variables': [variable for variable, keep in zip(variables, kept) if keep]
+    }
+
+
+def _standardized_values(data, method, dtype):
+    # Centred values scaled to unit norm, so the correlation of two columns is their dot product; missing values
+    # are set to the column mean and constant columns to zero, which leaves them uncorrelated with every column
+    values = np.empty(data.shape, dtype=dtype)
+    for position, column in enumerate(data.columns):
+        column_values = data[column].rank() if method == "spearman" else data[column]
+        column_values = column_values.to_numpy(dtype=float)
+        present = ~np.isnan(column_values)
+        centred = np.where(present, column_values - column_values[present].mean(), 0.0) if present.any() \
+            else np.zeros(len(column_values))
+        norm = np.sqrt(np.dot(centred, centred))
+        values[:, position] = centred / norm if norm > 0 else 0.0
+    return values
+
+
+def _correlated_pairs(values, threshold, block_size):
+    # Upper triangle of the correlation matrix at or above the threshold, one column block at a time
+    p = values.shape[1]
+    rows, cols, data = [], [], []
+    for start in range(0, p, block_size):
+        stop = min(start + block_size, p)
+        block = values[:, start:stop].T @ values[:, start:]
+        i, j = np.nonzero(np.abs(block) >= threshold)
+        upper = j > i
+        rows.append(i[upper] + start)
+        cols.append(j[upper] + start)
+        data.append(block[i[upper], j[upper]].astype(float))
+    if p == 0:
+        return sparse.csr_matrix((0, 0))
+    return sparse.coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                             shape=(p, p)).tocsr()
@@ -0,0 +1,114 @@
+import pandas as pd
+import numpy as np
+from creditpy.rank_auc import _binary_target
+from creditpy.histogram_metrics import _histogram_auc
+
+
+def discrimination_report(predictions, actual, n_points=101, n_groups=10):
+    """
+    Calculate the discriminatory power measures of a scored sample from a single sort of the scores.
+
+    The scores are sorted once and the events (defaults) and non-events are counted per distinct score.
+    AUC, Gini, KS, the CAP and ROC curves and the lift table are all derived from these cumulative
+    counts. Tied scores are treated as in roc_auc_score and ks_2samp.
+
+    Parameters:
+    predictions : array-like
+        Predicted values from the model. Higher values indicate a higher probability of default.
+    actual : array-like
+        Actual values from the test data. The greater of the two classes is taken as the default.
+    n_points : int, optional
+        The number of points of the CAP and ROC curves. Default is 101.
+    n_groups : int, optional
+        The number of equal-sized groups of the lift table, ordered from the highest score. Default is 10.
+
+    Returns:
+    dict
+        A dictionary containing:
+        - 'AUC': Area under the ROC curve.
+        - 'Gini': Gini coefficient.
+        - 'KS Statistic (%)': Kolmogorov-Smirnov statistic.
+        - 'KS Cutoff': The score at which the KS is reached; scores up to it are on one side.
+        - 'Accuracy Ratio': Accuracy ratio from the area under the CAP curve.
+        - 'lift_table': Counts, bad rate, gains and lift per group.
+        - 'cap_curve': Population share and share of defaults captured, from the highest score.
+        - 'roc_curve': False positive rate and true positive rate.
+
+    Examples:
+    >>> report = discrimination_report(test['PD'], test['creditability'])
+    >>> report['lift_table']
+    """
+    scores = np.asarray(predictions, dtype=float)
+    target = _binary_target(actual)
+    valid = ~np.isnan(scores) & ~np.isnan(target)
+    scores = scores[valid]
+    target = target[valid]
+
+    order = np.argsort(scores, kind='mergesort')
+    scores = scores[order]
+    target = target[order]
+    n = len(scores)
+    n_bad = target.sum()
+    n_good = n - n_bad
+    if n_bad == 0 or n_good == 0:
+        raise ValueError("Both events and non-events are needed to measure discriminatory power.")
+
+    # Events and non-events per distinct score, in ascending order
+    start = np.flatnonzero(np.r_[True, scores[1:] != scores[:-1]])
+    bad = np.add.reduceat(target, start)
+    good = np.diff(np.r_[start, n]) - bad
+    values = scores[start]
+
+    auc = float(_histogram_auc(bad, good))
+
+    # KS over all distinct scores
+    distance = np.abs(np.cumsum(bad) / n_bad - np.cumsum(good) / n_good)
+    ks_position = np.argmax(distance)
+
+    # Curves from the highest score down, starting at the origin
+    population_share = np.r_[0, np.cumsum((bad + good)[::-1]) / n]
+    bad_share = np.r_[0, np.cumsum(bad[::-1]) / n_bad]
+    good_share = np.r_[0, np.cumsum(good[::-1]) / n_good]
+
+    # Accuracy ratio: area between the CAP curve and the diagonal over that of the perfect model
+    cap_area = np.sum(np.diff(population_share) * (bad_share[1:] + bad_share[:-1]) / 2)
+    perfect_area = 1 - n_bad / n / 2
+    accuracy_ratio = (cap_area - 0.5) / (perfect_area - 0.5)
+
+    grid = np.linspace(0, 1, n_points)
+    cap_curve = pd.DataFrame({'Population.Share': grid, 'Bad.Share': np.interp(grid, population_share, bad_share)})
+    roc_curve = pd.DataFrame({'FPR': grid, 'TPR': np.interp(grid, good_share, bad_share)})
+
+    # Lift table: equal-sized groups by position from the highest score
+    descending_scores = scores[::-1]
+    groups = np.minimum(np.arange(n) * n_groups // n, n_groups - 1)
+    group_count = np.bincount(groups, minlength=n_groups)
+    group_bad = np.bincount(groups, weights=target[::-1], minlength=n_groups)
+    group_start = np.cumsum(group_count) - group_count
+    nonempty = group_count > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bad_rate = group_bad / group_count
+        lift_table = pd.DataFrame({
+            'Group': np.arange(1, n_groups + 1),
+            'Count': group_count,
+            'Bad.Count': group_bad,
+            'Good.Count': group_count - group_bad,
+            'Min.Score': np.where(nonempty, descending_scores[np.minimum(group_start + group_count - 1, n - 1)],
+                                  np.nan),
+            'Max.Score': np.where(nonempty, descending_scores[np.minimum(group_start, n - 1)], np.nan),
+            'Bad.Rate': bad_rate,
+            'Cumulative.Bad.Share': np.cumsum(group_bad) / n_bad,
+            'Lift': bad_rate / (n_bad / n),
+            'Cumulative.Lift': (np.cumsum(group_bad) / np.cumsum(group_count)) / (n_bad / n)
+        })
+
+    return {
+        'AUC': auc,
+        'Gini': 2 * auc - 1,
+        'KS Statistic (%)': distance[ks_position] * 100,
+        'KS Cutoff': values[ks_position],
+        'Accuracy Ratio': accuracy_ratio,
+        'lift_table': lift_table,
+        'cap_curve': cap_curve,
+        'roc_curve': roc_curve
+    }
@@ -0,0 +1,204 @@
+import pandas as pd
+import numpy as np
+from scipy.stats import chi2_contingency
+from creditpy.histogram_metrics import _histogram_auc, _histogram_ks
+from creditpy.iv_calc_engine import _factorize, _bin_iv
+from creditpy.psi_monitor import _psi, _open_bin_codes
+from creditpy.woe_binning_chunked import _bin_codes
+
+# Criterion name: summary column, and whether variables above ("max") or below ("min") the threshold are dropped
+_CRITERIA = {
+    "missing_ratio": ('Missing_Ratio', 'max'),
+    "iv": ('IV', 'min'),
+    "gini": ('Gini', 'min'),
+    "ks": ('KS (%)', 'min'),
+    "chisquare": ('ChiSquare.P.Value', 'max'),
+    "psi": ('PSI', 'max'),
+}
+
+
+def feature_screening(data, default_flag, plan, second_data=None, bins=None, psi_bins=10, verbose=True):
+    """
+    Screen variables with an ordered plan of criteria and thresholds in a single pass over every variable.
+
+    The bin-by-target contingency table of a variable is built once, the first time a criterion needs it, and
+    the missing ratio, IV, Gini, KS, chi-square test and PSI are all derived from it. The criteria are applied
+    in the order of the plan, and each criterion is only evaluated on the variables which passed the previous
+    ones. The dropped variables are removed from the data once, at the end.
+
+    With bins=None every distinct value is a bin, as in IV_calc_data, and the Gini is the absolute rank Gini of
+    Gini_univariate_data with method="rank". Numeric variables can instead be cut into quantile bins of the
+    dataset. The bins of non-numeric variables are ordered by their bad rate for the Gini and KS. Missing values
+    are left out of every measure except the missing ratio, and rows whose default flag is neither 0 nor 1 are
+    left out of the IV, Gini, KS and chi-square test.
+
+    The PSI compares the bin proportions of the dataset with those of second_data. Numeric variables always use
+    quantile bins of the dataset for the PSI, the bins of the table when bins is given and psi_bins quantile bins
+    otherwise, with open outer edges as in PSIBaseline, so values of second_data beyond the range of the dataset
+    are counted in the first or last bin. Levels of non-numeric variables which do not occur in the dataset are
+    counted in an extra bin, whose proportion in the dataset is taken as half an observation.
+
+    Parameters:
+    data : pandas DataFrame
+        The dataset.
+    default_flag : str
+        The name of the default flag variable.
+    plan : list of tuple or dict
+        The criteria and their thresholds, in the order they are applied. A variable is dropped when its
+        - "missing_ratio" is above the threshold,
+        - "iv" is below the threshold,
+        - "gini" (absolute) is below the threshold,
+        - "ks" (in percent) is below the threshold,
+        - "chisquare" p-value of the independence test of the bins and the default flag is above the threshold,
+        - "psi" (in percent, as PSI_calc_data) is above the threshold.
+        A criterion whose value is NaN, for example a Gini without both classes, drops nothing.
+    second_data : pandas DataFrame, optional
+        The comparison dataset of the "psi" criterion.
+    bins : int, optional
+        The number of quantile bins of numeric variables. Default is None, every distinct value is a bin.
+    psi_bins : int, optional
+        The number of quantile bins of numeric variables for the PSI when bins is None. Default is 10.
+    verbose : bool, optional
+        Print the number of variables dropped by every criterion. Default is True.
+
+    Returns:
+    dict
+        A dictionary containing:
+        - 'screened_data': The dataset without the dropped variables.
+        - 'summary': The value of every evaluated criterion per variable, and the criterion which dropped it.
+        - 'kept_variables': The variables which passed every criterion.
+
+    Examples:
+    result = feature_screening(train, "creditability",
+                               [("missing_ratio", 0.3), ("iv", 0.02), ("gini", 0.05), ("psi", 10)],
+                               second_data=test)
+    result['summary']
+    """
+    plan = list(plan.items()) if isinstance(plan, dict) else list(plan)
+    for criterion, _ in plan:
+        if criterion not in _CRITERIA:
+            raise ValueError(f"Unknown criterion '{criterion}'. Use one of {', '.join(_CRITERIA)}.")
+        if criterion == "psi" and second_data is None:
+            raise ValueError("The 'psi' criterion needs second_data.")
+
+    # Encode the default flag once: 0 for good, 1 for bad, -1 for anything else
+    flag = pd.to_numeric(data[default_flag], errors='coerce').to_numpy()
+    target = np.full(len(flag), -1, dtype=np.int64)
+    target[flag == 0] = 0
+    target[flag == 1] = 1
+
+    variables = [column for column in data.columns if column != default_flag]
+    summary = pd.DataFrame({'Variable': variables}).set_index('Variable')
+    summary['Dropped.By'] = None
+    psi_bins = psi_bins if any(criterion == "psi" for criterion, _ in plan) else None
+    tables = {}
+    survivors = variables
+    for criterion, threshold in plan:
+        column, bound = _CRITERIA[criterion]
+        values = []
+        for variable in survivors:
+            if variable not in tables:
+                tables[variable] = _contingency_table(data[variable], target, bins, psi_bins)
+            values.append(_criterion_value(criterion, tables[variable], second_data, variable))
+
+        values = np.asarray(values, dtype=float)
+        summary.loc[survivors, column] = values
+        dropped = values > threshold if bound == 'max' else values < threshold
+        summary.loc[[variable for variable, drop in zip(survivors, dropped) if drop], 'Dropped.By'] = criterion
+        survivors = [variable for variable, drop in zip(survivors, dropped) if not drop]
+        if verbose:
+            print(f"{criterion}: {int(dropped.sum())} variables dropped, {len(survivors)} remaining")
+
+    dropped_variables = [variable for variable in variables if variable not in set(survivors)]
+    return {
+        'screened_data': data.drop(columns=dropped_variables),
+        'summary': summary.reset_index(),
+        'kept_variables': survivors
+    }
+
+
+def _contingency_table(values, target, bins, psi_bins):
+    # Good and bad counts of every bin, the count of every bin over all rows and the missing count of a variable,
+    # with the bin order for the Gini and KS and, when psi_bins is given, the PSI bins and their counts
+    numeric = pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+    array = values.to_numpy(dtype=float, na_value=np.nan) if numeric else None
+    if bins is not None and numeric:
+        edges = _quantile_edges(array, bins)
+        codes = _bin_codes(array, edges)
+        n_bins = len(edges) - 1
+    else:
+        codes, uniques = _factorize(values)
+        n_bins = len(uniques)
+
+    present = codes >= 0
+    valid = present & (target >= 0)
+    counts = np.bincount(codes[valid] * 2 + target[valid], minlength=2 * n_bins).reshape(-1, 2)
+    totals = np.bincount(codes[present], minlength=n_bins)
+
+    order = np.arange(n_bins)
+    if not numeric:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            order = np.argsort(counts[:, 1] / counts.sum(axis=1), kind='stable')
+
+    psi_binning = None
+    if psi_bins is not None:
+        if not numeric:
+            psi_binning = ('uniques', pd.Index(uniques), totals)
+        elif bins is not None:
+            psi_binning = ('edges', edges, totals)
+        else:
+            psi_edges = _quantile_edges(array, psi_bins)
+            psi_codes = _open_bin_codes(array, psi_edges)
+            psi_binning = ('edges', psi_edges,
+                           np.bincount(psi_codes[psi_codes >= 0], minlength=len(psi_edges) - 1))
+    return {
+        'good': counts[:, 0],
+        'bad': counts[:, 1],
+        'missing': int((~present).sum()),
+        'rows': len(codes),
+        'order': order,
+        'psi_binning': psi_binning
+    }
+
+
+def _quantile_edges(values, bins):
+    # Distinct quantile edges of the non-missing values; a single edge is doubled into one bin
+    present = values[~np.isnan(values)]
+    edges = np.unique(np.quantile(present, np.linspace(0, 1, bins + 1))) if len(present) else np.array([0.0])
+    return np.r_[edges, edges] if len(edges) < 2 else edges
+
+
+def _criterion_value(criterion, table, second_data, variable):
+    # Value of a criterion derived from the contingency table of a variable
+    good, bad = table['good'], table['bad']
+    if criterion == "missing_ratio":
+        return table['missing'] / table['rows'] if table['rows'] else np.nan
+    if criterion == "iv":
+        return _bin_iv(good, bad).sum()
+    if criterion == "gini":
+        return abs(2 * _histogram_auc(bad[table['order']], good[table['order']]) - 1)
+    if criterion == "ks":
+        return _histogram_ks(bad[table['order']], good[table['order']]) * 100
+    if criterion == "chisquare":
+        counts = np.column_stack([good, bad])
+        counts = counts[counts.sum(axis=1) > 0]
+        if len(counts) < 2 or np.any(counts.sum(axis=0) == 0):
+            return np.nan
+        return chi2_contingency(counts, correction=False)[1]
+
+    # PSI of the bin proportions of the dataset and second_data
+    kind, binning, totals = table['psi_binning']
+    second_values = second_data[variable]
+    if kind == 'edges':
+        codes = _open_bin_codes(pd.to_numeric(second_values, errors='coerce').to_numpy(dtype=float), binning)
+        second_counts = np.bincount(codes[codes >= 0], minlength=len(totals))
+        main_counts = totals.astype(float)
+    else:
+        # Levels which do not occur in the dataset go to an extra bin, with half an observation in the dataset
+        codes = binning.get_indexer(second_values)
+        unseen = int(((codes < 0) & second_values.notna().to_numpy()).sum())
+        second_counts = np.r_[np.bincount(codes[codes >= 0], minlength=len(totals)), unseen]
+        main_counts = np.r_[totals, 0.5 if unseen else 0.0]
+    if second_counts.sum() == 0 or totals.sum() == 0:
+        return np.nan
+    return _psi(main_counts / main_counts.sum(), second_counts / second_counts.sum())
@@ -1,7 +1,8 @@
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score, roc_curve, auc
+from creditpy.rank_auc import _binary_target, _rank_gini_matrix
 
-def Gini_univariate(data, default_flag, variable):
+def Gini_univariate(data, default_flag, variable, method="logit"):
     """
     Calculate the univariate Gini coefficient from the estimated values calculated by logistic regression of a variable.
 
@@ -9,10 +10,19 @@ def Gini_univariate(data, default_flag, variable):
     - data (DataFrame): The dataset.
     - default_flag (str): The name of the default flag variable.
     - variable (str): The name of the variable for which the Gini value is to be calculated.
+    - method (str, optional): "logit" fits a logistic regression. "rank" computes the same Gini from the ranks
+                              of the raw values without fitting a model. Default is "logit".
 
     Returns:
     float: Univariate Gini value.
     """
+    if method not in ("logit", "rank"):
+        raise ValueError(f"Unknown method '{method}'. Use 'logit' or 'rank'.")
+
+    if method == "rank":
+        return _rank_gini_matrix(data[[variable]].to_numpy(dtype=float), _binary_target(data[default_flag]),
+                                 intercept_penalty=1.0)[0]
+
     X = data[[variable]]
     y = data[default_flag]
 
@@ -27,4 +37,3 @@ def Gini_univariate(data, default_flag, variable):
     univ_gini = 2 * roc_auc_score(y, y_pred) - 1
 
     return univ_gini
-
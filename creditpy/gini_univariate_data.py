@@ -1,39 +1,35 @@
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
 import pandas as pd
+from creditpy.stats_cache import _cached_column_apply
+from creditpy.rank_auc import _binary_target, _rank_gini_matrix
 
-def Gini_univariate_data(data, default_flag):
+def Gini_univariate_data(data, default_flag, method="logit", n_jobs=1, backend=None, cache=None):
     """
     Calculate the Gini coefficient from the estimated values calculated by logistic regression for each variable in the dataset.
 
     Parameters:
     - data (DataFrame): The dataset.
     - default_flag (str): The name of the default flag variable.
+    - method (str, optional): "logit" fits a logistic regression for each variable. "rank" computes the same
+                              Gini from the ranks of the raw values without fitting a model, leaving out
+                              missing values. Default is "logit".
+    - n_jobs (int, optional): The number of workers. None or -1 uses all CPU cores. Default is 1.
+    - backend (str, optional): "serial", "threads" or "processes". Default is "serial" for a single worker
+                               and "processes" otherwise.
+    - cache (StatsCache, optional): Cache of the Gini of every column. Columns whose values and default flag
+                                    are unchanged are not fitted again. Default is None.
 
     Returns:
     DataFrame: DataFrame containing variables and their corresponding Gini values.
     """
-    gini_values = []
-    variable_names = []
-
-    for column in data.columns:
-        if column != default_flag:
-            X = data[[column]]
-            y = data[default_flag]
-
-            # Fit logistic regression model
-            model = LogisticRegression(solver='liblinear')
-            model.fit(X, y)
-
-            # Predict probabilities
-            y_pred = model.predict_proba(X)[:, 1]
+    if method not in ("logit", "rank"):
+        raise ValueError(f"Unknown method '{method}'. Use 'logit' or 'rank'.")
 
-            # Calculate Gini coefficient
-            gini_value = 2 * roc_auc_score(y, y_pred) - 1
-
-            # Append variable name and Gini value to lists
-            variable_names.append(column)
-            gini_values.append(gini_value)
+    variable_names = [column for column in data.columns if column != default_flag]
+    gini_values = _cached_column_apply(cache, "gini", _gini_block, [data], variable_names,
+                                       args=(default_flag, method), shared_columns=[default_flag], params=method,
+                                       n_jobs=n_jobs, backend=backend)
 
     # Create DataFrame from lists
     gini_df = pd.DataFrame({'Variable': variable_names, 'Gini': gini_values})
@@ -46,3 +42,32 @@ def Gini_univariate_data(data, default_flag):
 
     return ordered_gini_df
 
+
+def _gini_block(frames, columns, default_flag, method):
+    # Univariate Gini values of a block of columns
+    data = frames[0]
+
+    if method == "rank":
+        # A univariate logit is monotone in the variable, so its Gini is the signed rank Gini of the variable
+        return list(_rank_gini_matrix(data[columns].to_numpy(dtype=float), _binary_target(data[default_flag]),
+                                      intercept_penalty=1.0))
+
+    gini_values = []
+    for column in columns:
+        X = data[[column]]
+        y = data[default_flag]
+
+        # Fit logistic regression model
+        model = LogisticRegression(solver='liblinear')
+        model.fit(X, y)
+
+        # Predict probabilities
+        y_pred = model.predict_proba(X)[:, 1]
+
+        # Calculate Gini coefficient
+        gini_value = 2 * roc_auc_score(y, y_pred) - 1
+
+        # Append Gini value to list
+        gini_values.append(gini_value)
+
+    return gini_values
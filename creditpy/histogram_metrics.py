@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def _score_edges(edges=None, bins=1000, score_range=(0.0, 1.0)):
+    # Bin edges of a fixed score grid
+    if edges is not None:
+        edges = np.unique(np.asarray(edges, dtype=float))
+        if len(edges) < 2:
+            raise ValueError("At least two distinct edges are needed.")
+        return edges
+    return np.linspace(score_range[0], score_range[1], bins + 1)
+
+
+def _score_bins(scores, edges):
+    # Bin of every score on the grid; scores outside the grid fall into the first or last bin
+    bins = np.searchsorted(edges, scores, side='right') - 1
+    return np.clip(bins, 0, len(edges) - 2)
+
+
+def _histogram_counts(scores, target, edges, codes=None, n_groups=1):
+    # Bad and good counts of every score bin, per group when group codes are given.
+    # Observations with a missing score, a missing target or a negative group code are not counted.
+    scores = np.asarray(scores, dtype=float)
+    valid = ~np.isnan(scores) & ~np.isnan(target)
+    if codes is None:
+        codes = np.zeros(len(scores), dtype=np.intp)
+    valid &= codes >= 0
+    n_bins = len(edges) - 1
+    cells = codes[valid] * n_bins + _score_bins(scores[valid], edges)
+    bad = np.bincount(cells, weights=target[valid], minlength=n_groups * n_bins)
+    good = np.bincount(cells, weights=1 - target[valid], minlength=n_groups * n_bins)
+    return bad.reshape(n_groups, n_bins), good.reshape(n_groups, n_bins)
+
+
+def _histogram_auc(bad, good):
+    # AUC of the histograms along the last axis; scores in the same bin are counted as ties
+    n_bad = bad.sum(axis=-1)
+    n_good = good.sum(axis=-1)
+    good_below = np.cumsum(good, axis=-1) - good
+    with np.errstate(divide='ignore', invalid='ignore'):
+        auc = (bad * (good_below + good / 2)).sum(axis=-1) / (n_bad * n_good)
+    return np.where((n_bad > 0) & (n_good > 0), auc, np.nan)
+
+
+def _histogram_ks(bad, good):
+    # Kolmogorov-Smirnov statistic of the histograms along the last axis, evaluated at the bin edges
+    n_bad = bad.sum(axis=-1, keepdims=True)
+    n_good = good.sum(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distance = np.abs(np.cumsum(bad, axis=-1) / n_bad - np.cumsum(good, axis=-1) / n_good)
+    ks = distance.max(axis=-1) if distance.shape[-1] else np.zeros(distance.shape[:-1])
+    return np.where((n_bad[..., 0] > 0) & (n_good[..., 0] > 0), ks, np.nan)
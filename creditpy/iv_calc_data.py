@@ -1,73 +1,53 @@
 import pandas as pd
-import numpy as np
+from creditpy.iv_calc_engine import IV_calc_engine
+from creditpy.stats_cache import _cached_column_apply
 
 
-def IV_calc(data, default_flag, variable):
-    """
-    Calculate the Information Value (IV) for a given variable.
-
-    Parameters:
-    - data (DataFrame): The dataset.
-    - default_flag (str or numeric): The name of the default flag variable.
-    - variable (str): The name of the variable for which IV is to be calculated.
-
-    Returns:
-    float: The calculated Information Value (IV).
-    """
-    good = data[data[default_flag] == 0]
-    bad = data[data[default_flag] == 1]
-
-    print("Good data:")
-    print(good.head())
-    print("\nBad data:")
-    print(bad.head())
-
-    x = good[variable].value_counts().to_frame().reset_index()
-    x.columns = ['Var1', 'Freq.x']
-    y = bad[variable].value_counts().to_frame().reset_index()
-    y.columns = ['Var1', 'Freq.y']
-
-    print("\nCounts for variable", variable, "in good data:")
-    print(x)
-    print("\nCounts for variable", variable, "in bad data:")
-    print(y)
-
-    merged = pd.merge(x, y, on="Var1", how="outer")
-    merged['percentx'] = merged['Freq.x'] / merged['Freq.x'].sum()
-    merged['percenty'] = merged['Freq.y'] / merged['Freq.y'].sum()
-
-    print("\nMerged data:")
-    print(merged)
-
-    merged['IV'] = (merged['percentx'] - merged['percenty']) * np.log(merged['percentx'] / merged['percenty'])
-    IV_RESULT = merged['IV'].sum()
-
-    print("\nIV for variable", variable, ":", IV_RESULT)
-
-    return IV_RESULT
-
-
-def IV_calc_data(data, default_flag):
+def IV_calc_data(data, default_flag, verbose=True, return_counts=False, n_jobs=1, backend=None, cache=None):
     """
     Calculate the Information Value (IV) for each variable in the dataset.
 
     Parameters:
     - data (DataFrame): The dataset.
     - default_flag (str or numeric): The name of the default flag variable.
+    - verbose (bool, optional): Print the count table and the IV of each variable. Default is True.
+    - return_counts (bool, optional): Also return the good and bad counts of every bin. Default is False.
+    - n_jobs (int, optional): The number of workers. None or -1 uses all CPU cores. Default is 1.
+    - backend (str, optional): "serial", "threads" or "processes". Default is "serial" for a single worker
+                               and "processes" otherwise.
+    - cache (StatsCache, optional): Cache of the IV and counts of every column. Columns whose values and
+                                    default flag are unchanged are not scanned again. Default is None.
 
     Returns:
     DataFrame: DataFrame containing variables and their corresponding IVs.
+               If return_counts is True, a tuple of this DataFrame and the per-bin counts is returned.
     """
-    iv_column_names = []
-    Information_Values = []
-
-    for column in data.columns:
-        if column != default_flag:
-            iv = IV_calc(data, default_flag, column)
-            iv_column_names.append(column)
-            Information_Values.append(iv)
+    variables = [column for column in data.columns if column != default_flag]
+    # With a cache the counts are printed here, so that cached columns are printed too
+    results = _cached_column_apply(cache, "iv", _iv_block, [data], variables,
+                                   args=(default_flag, verbose and cache is None), shared_columns=[default_flag],
+                                   n_jobs=n_jobs, backend=backend)
+    if verbose and cache is not None:
+        for variable, (iv, counts) in zip(variables, results):
+            print("\nCounts for variable", variable, ":")
+            print(counts.drop(columns=['Variable']))
+            print("\nIV for variable", variable, ":", iv)
+
+    iv_summary = pd.DataFrame({'Variable': variables, 'IV': [iv for iv, _ in results]})
+
+    if return_counts:
+        count_tables = [counts for _, counts in results]
+        if count_tables:
+            bin_counts = pd.concat(count_tables, ignore_index=True)
+        else:
+            bin_counts = pd.DataFrame(columns=['Variable', 'Bin', 'Good.Count', 'Bad.Count', 'IV'])
+        return iv_summary, bin_counts
+    return iv_summary
 
-    iv_summary = pd.DataFrame({'Variable': iv_column_names, 'IV': Information_Values})
-    iv_summary = iv_summary[iv_summary['Variable'] != default_flag].reset_index(drop=True)
 
-    return iv_summary
+def _iv_block(frames, columns, default_flag, verbose):
+    # IV and bin counts of a block of columns, one (IV, counts) pair per column
+    result = IV_calc_engine(frames[0], default_flag, variables=columns, verbose=verbose)
+    bin_counts = result['bin_counts']
+    return [(iv, bin_counts[bin_counts['Variable'] == variable])
+            for variable, iv in zip(result['iv_summary']['Variable'], result['iv_summary']['IV'])]
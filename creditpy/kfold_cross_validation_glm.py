@@ -1,14 +1,19 @@
+import time
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import StratifiedKFold
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
+from creditpy.parallel_backend import parallel_map, _resolve_backend
 
-def k_fold_cross_validation_glm(model_data, default_flag, folds, seed_value):
+def k_fold_cross_validation_glm(model_data, default_flag, folds, seed_value, repeats=1, warm_start=False, n_jobs=1,
+                                backend=None):
     """
     K Fold Cross Validation Gini
 
     This function creates k fold cross-validation data sets and calculates Gini coefficient for logistic regression.
+    The design matrix is extracted once as a contiguous array and the folds are index arrays into it. The folds of
+    all repeats can be fitted in parallel.
 
     Parameters:
     model_data : pandas DataFrame
@@ -19,61 +24,94 @@ def k_fold_cross_validation_glm(model_data, default_flag, folds, seed_value):
         The number of folds desired.
     seed_value : int
         A seed value for replicability.
+    repeats : int, optional
+        The number of times the k fold cross-validation is repeated with different folds. The first repeat
+        uses the same folds as a single k fold cross-validation. Default is 1.
+    warm_start : bool, optional
+        Initialize the fit of every fold from the coefficients of the model fitted on the full sample.
+        Default is False.
+    n_jobs : int, optional
+        The number of workers. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
 
     Returns:
     pandas DataFrame
-        A DataFrame containing Gini coefficients for each fold and their averages.
+        A DataFrame containing Gini coefficients and fit times in seconds for each fold and their averages.
+        With more than one repeat, the repeat of every fold is given in the Repeat column.
 
     Examples:
-    default_f = ['1','0','0', '1','1','0','0','1','1']
+    default_f = [1, 0, 0, 1, 1, 0, 0, 1, 1]
     birth_year = [1980, 1985, 1971, 1971, 1985, 1971, 1980, 1980, 1985]
     job = [1, 1, 2, 2, 2, 3, 3, 2, 3]
     example_data = pd.DataFrame({'default_f': default_f, 'birth_year': birth_year, 'job': job})
-    k_fold_cross_validation_glm(example_data, "default_f", 10, 1)
+    k_fold_cross_validation_glm(example_data, "default_f", 3, 1, repeats=5, n_jobs=2)
     """
     np.random.seed(seed_value)
-    # Randomly shuffle the data
-    model_data = model_data.sample(frac=1).reset_index(drop=True)
+    # Randomly shuffle the rows, as model_data.sample(frac=1) does
+    shuffle = pd.Series(np.arange(len(model_data))).sample(frac=1).to_numpy()
 
-    # Drop non-numeric columns
-    numeric_columns = model_data.select_dtypes(include=[np.number]).columns
-    model_data = model_data[numeric_columns]
+    # Numeric predictor columns as one contiguous array
+    numeric_columns = [column for column in model_data.select_dtypes(include=[np.number]).columns
+                       if column != default_flag]
+    X = np.ascontiguousarray(model_data[numeric_columns].to_numpy(dtype=float)[shuffle])
+    y = model_data[default_flag].to_numpy()[shuffle]
 
-    # Initialize arrays to store Gini coefficients
-    gini_fold_train = []
-    gini_fold_test = []
+    init_coef = init_intercept = None
+    if warm_start:
+        full_model = LogisticRegression().fit(X, y)
+        init_coef, init_intercept = full_model.coef_, full_model.intercept_
 
-    # Perform k-fold cross-validation
-    skf = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed_value)
-    for train_index, test_index in skf.split(model_data.drop(columns=[default_flag]), model_data[default_flag]):
-        train_data, test_data = model_data.iloc[train_index], model_data.iloc[test_index]
+    # Folds of all repeats as index arrays
+    fold_indices = []
+    for repeat in range(repeats):
+        skf = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed_value + repeat)
+        fold_indices.extend(skf.split(np.zeros(len(y)), y))
 
-        # Fit logistic regression model
-        model = LogisticRegression()
-        model.fit(train_data.drop(columns=[default_flag]), train_data[default_flag])
-
-        # Predict probabilities
-        train_pred_prob = model.predict_proba(train_data.drop(columns=[default_flag]))[:, 1]
-        test_pred_prob = model.predict_proba(test_data.drop(columns=[default_flag]))[:, 1]
-
-        # Calculate Gini coefficients
-        gini_train = 2 * roc_auc_score(train_data[default_flag], train_pred_prob) - 1
-        gini_test = 2 * roc_auc_score(test_data[default_flag], test_pred_prob) - 1
-
-        # Append Gini coefficients
-        gini_fold_train.append(gini_train)
-        gini_fold_test.append(gini_test)
-
-    # Calculate average Gini coefficients
-    avg_gini_train = np.mean(gini_fold_train)
-    avg_gini_test = np.mean(gini_fold_test)
+    # One block of folds per worker, so every worker receives the design matrix once
+    _, workers = _resolve_backend(n_jobs, backend, len(fold_indices))
+    blocks = np.array_split(np.arange(len(fold_indices)), workers)
+    tasks = [(X, y, [fold_indices[i] for i in block], init_coef, init_intercept) for block in blocks]
+    results = [result for block_results in parallel_map(_fit_folds, tasks, n_jobs=workers, backend=backend)
+               for result in block_results]
+    gini_fold_train, gini_fold_test, fit_times = (list(values) for values in zip(*results))
 
     # Create DataFrame to store results
     fold_result = pd.DataFrame({
-        'Fold': range(1, folds + 1),
+        'Fold': [fold + 1 for _ in range(repeats) for fold in range(folds)],
         'GiniTrain': gini_fold_train,
-        'GiniTest': gini_fold_test
+        'GiniTest': gini_fold_test,
+        'FitTime': fit_times
     })
-    fold_result.loc[len(fold_result)] = ['Average', avg_gini_train, avg_gini_test]
+    if repeats > 1:
+        fold_result.insert(0, 'Repeat', [repeat + 1 for repeat in range(repeats) for _ in range(folds)])
+        fold_result.loc[len(fold_result)] = ['Average', 'Average', np.mean(gini_fold_train),
+                                             np.mean(gini_fold_test), np.mean(fit_times)]
+    else:
+        fold_result.loc[len(fold_result)] = ['Average', np.mean(gini_fold_train), np.mean(gini_fold_test),
+                                             np.mean(fit_times)]
 
     return fold_result
+
+
+def _fit_folds(X, y, fold_indices, init_coef=None, init_intercept=None):
+    # Train and test Gini and fit time of every fold of a block
+    results = []
+    for train_index, test_index in fold_indices:
+        X_train, y_train = X[train_index], y[train_index]
+        X_test, y_test = X[test_index], y[test_index]
+
+        # Fit logistic regression model
+        start = time.perf_counter()
+        model = LogisticRegression(warm_start=init_coef is not None)
+        if init_coef is not None:
+            model.coef_ = init_coef.copy()
+            model.intercept_ = init_intercept.copy()
+        model.fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+
+        # Predict probabilities and calculate Gini coefficients
+        gini_train = 2 * roc_auc_score(y_train, model.predict_proba(X_train)[:, 1]) - 1
+        gini_test = 2 * roc_auc_score(y_test, model.predict_proba(X_test)[:, 1]) - 1
+        results.append((gini_train, gini_test, fit_time))
+    return results
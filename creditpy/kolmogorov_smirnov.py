@@ -1,6 +1,8 @@
 from scipy.stats import ks_2samp
+from creditpy.streaming_auc import _streaming_result
 
-def Kolmogorov_Smirnov(data, default_flag, PD):
+def Kolmogorov_Smirnov(data, default_flag, PD, method="exact", bins=10000, score_range=(0.0, 1.0), grid="fixed",
+                       chunksize=1000000):
     """
     Calculate the Kolmogorov-Smirnov (KS) statistic for a given scoring data.
 
@@ -8,10 +10,26 @@ def Kolmogorov_Smirnov(data, default_flag, PD):
     - data (DataFrame): The dataset.
     - default_flag (str): The name of the default flag variable.
     - PD (str): The name of the PD variable.
+    - method (str, optional): "exact" for ks_2samp, or "histogram" for the approximate KS of StreamingAUC,
+                              which counts the PDs into a grid of bins in one linear pass with O(bins)
+                              memory and uses the asymptotic p-value. Default is "exact".
+    - bins (int, optional): The number of bins of the histogram method. Default is 10000.
+    - score_range (tuple, optional): The range of the fixed grid of the histogram method. Default is (0, 1).
+    - grid (str, optional): "fixed" or "adaptive" grid of the histogram method. Default is "fixed".
+    - chunksize (int, optional): The number of rows counted at a time by the histogram method.
+                                 Default is 1000000.
 
     Returns:
-    KS_Result: A tuple containing the KS statistic and the p-value.
+    KS_Result: A tuple containing the KS statistic and the p-value. The histogram method adds the
+               guaranteed error bound of the KS statistic, "KS Error Bound (%)".
     """
+    if method == "histogram":
+        result = _streaming_result(data[PD].to_numpy(dtype=float), data[default_flag], bins, score_range, grid,
+                                   chunksize)
+        return {key: result[key] for key in ("KS Statistic (%)", "P-Value", "KS Error Bound (%)")}
+    if method != "exact":
+        raise ValueError(f"Unknown method '{method}'. Use 'exact' or 'histogram'.")
+
     events = data[data[default_flag] == 1][PD]
     non_events = data[data[default_flag] == 0][PD]
 
@@ -23,5 +41,3 @@ def Kolmogorov_Smirnov(data, default_flag, PD):
     }
 
     return KS_Result
-
-
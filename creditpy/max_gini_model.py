@@ -1,16 +1,28 @@
+import time
 import pandas as pd
-from itertools import combinations
+import numpy as np
+from itertools import combinations, islice
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
+from creditpy.parallel_backend import parallel_map
+from creditpy.rank_auc import _binary_target, _rank_gini_matrix
+from creditpy.histogram_metrics import _histogram_auc
 
+SEARCH_MODES = ("exhaustive", "forward", "backward", "beam", "branch_and_bound")
 
-def max_gini_model(data, default_flag, seed_value=1):
+
+def max_gini_model(data, default_flag, seed_value=1, search="exhaustive", max_variables=None, beam_width=5,
+                   top_k=None, max_fits=None, time_limit=None, warm_start=False, n_jobs=1, backend=None,
+                   verbose=True):
     """
     Maximum Gini Model
 
     This function finds the model which gives the maximum Gini value. Statistical requirements will not be provided.
     Can only be used to give an inference.
 
+    The candidate fits of each search step run with the selected execution backend. By default every model is
+    fitted from scratch, so the results do not depend on n_jobs or on the search order.
+
     Parameters:
     data : pandas DataFrame
         The dataset.
@@ -18,10 +30,49 @@ def max_gini_model(data, default_flag, seed_value=1):
         The column name of the default flag.
     seed_value : int, optional
         A seed value for replicability. Default is 1.
+    search : str, optional
+        The search strategy. Default is "exhaustive".
+        - "exhaustive": fits every combination of the predictor variables.
+        - "forward": adds the variable which increases the Gini most until no variable increases it.
+        - "backward": starts from all variables and removes the variable whose removal costs the least Gini.
+        - "beam": grows the best beam_width subsets of each size by one variable at a time.
+        - "branch_and_bound": depth-first enumeration which skips a branch when its bound is below the
+          top_k-th best Gini found so far, and returns the same best subsets as the exhaustive search.
+          The bound of a branch is the Gini of the groups of equal values of all the variables the branch may
+          add, ranked by their bad rate. No score which depends only on these variables, and so no model of the
+          branch, can rank the observations better, whether or not its fit has converged. The bound needs no
+          model fit; it prunes most for discrete variables, such as binned or WOE variables, and hardly at all
+          for variables with nearly unique values.
+    max_variables : int, optional
+        The maximum number of variables in a model. Default is no limit.
+    beam_width : int, optional
+        The number of subsets kept at each size by the beam search. Default is 5.
+    top_k : int, optional
+        If given, a dictionary with the best model and a leaderboard of the top_k subsets is returned.
+    max_fits : int, optional
+        Stop the search after this many model fits. Default is no limit.
+    time_limit : float, optional
+        Stop the search after this many seconds. Fits which have not started when the limit runs out are
+        skipped; a fit which is running may finish, so the limit can be exceeded by the time of one fit.
+        Default is no limit.
+    warm_start : bool, optional
+        Start every candidate fit from the coefficients of the subset it was derived from. This is faster, but
+        the solver may stop at slightly different coefficients, and so Gini values, than a fit from scratch.
+        The exhaustive search fits all subsets of one size before the next size, so the parent of every subset
+        has been fitted and the results do not depend on n_jobs. Default is False.
+    n_jobs : int, optional
+        The number of workers for the candidate fits. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+    verbose : bool, optional
+        Print the formula and the Gini of every fitted model. Default is True.
 
     Returns:
     sklearn.linear_model._logistic.LogisticRegression
         The logistic regression model with the maximum Gini value.
+        If top_k is given, a dictionary containing:
+        - 'model': The logistic regression model with the maximum Gini value.
+        - 'leaderboard': DataFrame of the top_k subsets ranked by Gini.
 
     Examples:
     default_f = ['1','0','0', '1','1','0','0','1','1']
@@ -29,24 +80,252 @@ def max_gini_model(data, default_flag, seed_value=1):
     job = [1, 1, 2, 2, 2, 3, 3, 2, 3]
     example_data = pd.DataFrame({'default_f': default_f, 'birth_year': birth_year, 'job': job})
     max_gini_model(example_data, "default_f", 10)
+    max_gini_model(example_data, "default_f", 10, search="forward", top_k=3)
     """
+    if search not in SEARCH_MODES:
+        raise ValueError(f"Unknown search '{search}'. Use one of {SEARCH_MODES}.")
+
     # Get all combinations of predictor variables
     predictor_cols = [col for col in data.columns if col != default_flag]
-    models = []
-    max_gini = -1
-    best_model = None
-    for r in range(1, len(predictor_cols) + 1):
-        for comb in combinations(predictor_cols, r):
-            formula = f"{default_flag} ~ {' + '.join(comb)}"
-            model = LogisticRegression()
-            model.fit(data[list(comb)], data[default_flag])
-            y_pred_prob = model.predict_proba(data[list(comb)])[:, 1]
-            gini = 2 * roc_auc_score(data[default_flag], y_pred_prob) - 1
-            print(f"Formula: {formula}, Gini: {gini}")
-            if gini > max_gini:
-                max_gini = gini
-                best_model = model
-    print(f"Best Model Gini: {max_gini}")
-    return best_model
+    if max_variables is None:
+        max_variables = len(predictor_cols)
+
+    searcher = _SubsetSearch(data, default_flag, predictor_cols, max_fits, time_limit, warm_start, n_jobs, backend,
+                             verbose)
+    strategy = {
+        "exhaustive": _exhaustive_search,
+        "forward": _forward_search,
+        "backward": _backward_search,
+        "beam": _beam_search,
+        "branch_and_bound": _branch_and_bound_search
+    }[search]
+    strategy(searcher, max_variables, beam_width, top_k or 1)
+
+    if searcher.budget_exhausted() and verbose:
+        print(f"Search stopped after {searcher.fits} fits and {time.time() - searcher.start:.1f} seconds.")
+
+    leaderboard = searcher.leaderboard(max_variables)
+    if leaderboard.empty:
+        raise ValueError("No model could be fitted within the given budget.")
+    best_model = searcher.results[leaderboard['Subset'].iloc[0]][1]
+    max_gini = leaderboard['Gini'].iloc[0]
+    if verbose:
+        print(f"Best Model Gini: {max_gini}")
+
+    if top_k is None:
+        return best_model
+    return {
+        'model': best_model,
+        'leaderboard': leaderboard.head(top_k).drop(columns=['Subset'])
+    }
+
+
+def _group_gini_bound(X, target):
+    # Highest in-sample Gini of any score which is a function of the columns of X: the Gini of the groups of
+    # equal rows ranked by their bad rate, which orders them by likelihood ratio
+    _, codes = np.unique(X.to_numpy(dtype=float), axis=0, return_inverse=True)
+    codes = codes.ravel()
+    bad = np.bincount(codes, weights=target)
+    good = np.bincount(codes, weights=1 - target)
+    order = np.argsort(bad / (bad + good), kind='mergesort')
+    return 2 * _histogram_auc(bad[order], good[order]) - 1
+
+
+def _fit_subset(X, y, init_coef, init_intercept):
+    # Fit a logistic regression, warm-started from the given coefficients if any, and return its Gini
+    model = LogisticRegression(warm_start=init_coef is not None)
+    if init_coef is not None:
+        model.coef_ = init_coef.reshape(1, -1)
+        model.intercept_ = np.array([init_intercept])
+    model.fit(X, y)
+    model.warm_start = False
+    y_pred_prob = model.predict_proba(X)[:, 1]
+    gini = 2 * roc_auc_score(y, y_pred_prob) - 1
+    return gini, model
+
+
+class _SubsetSearch:
+    # Fits subsets of the predictor variables with a shared cache and a fit-count / wall-clock budget
+
+    def __init__(self, data, default_flag, predictor_cols, max_fits, time_limit, warm_start, n_jobs, backend,
+                 verbose):
+        self.data = data
+        self.default_flag = default_flag
+        self.predictor_cols = predictor_cols
+        self.y = data[default_flag]
+        self.max_fits = max_fits
+        self.time_limit = time_limit
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.verbose = verbose
+        self.start = time.time()
+        self.fits = 0
+        self.results = {}  # sorted tuple of column positions -> (gini, model)
+        self.bounds = {}  # sorted tuple of column positions -> Gini bound of its subsets
+        self.target = None
+
+    def budget_exhausted(self):
+        if self.max_fits is not None and self.fits >= self.max_fits:
+            return True
+        return self.time_limit is not None and time.time() - self.start >= self.time_limit
+
+    def evaluate(self, candidates):
+        # candidates: list of (subset, parent) tuples of column positions; parent may be None.
+        # Returns the Gini of every candidate which has been fitted, within the budget.
+        tasks = []
+        pending = []
+        for subset, parent in candidates:
+            subset = tuple(sorted(subset))
+            if subset in self.results or subset in pending:
+                continue
+            if self.max_fits is not None and self.fits + len(pending) >= self.max_fits:
+                break
+            init_coef, init_intercept = self._warm_start(subset, parent)
+            columns = [self.predictor_cols[i] for i in subset]
+            tasks.append((self.data[columns], self.y, init_coef, init_intercept))
+            pending.append(subset)
+
+        if tasks and not self.budget_exhausted():
+            # Fits which have not started when the time limit runs out are skipped and return None
+            results = parallel_map(_fit_subset, tasks, n_jobs=self.n_jobs, backend=self.backend,
+                                   timeout=self._time_left())
+            for subset, result in zip(pending, results):
+                if result is None:
+                    continue
+                self.results[subset] = result
+                self.fits += 1
+                if self.verbose:
+                    print(f"Formula: {self._formula(subset)}, Gini: {result[0]}")
+
+        ginis = {}
+        for subset, _ in candidates:
+            subset = tuple(sorted(subset))
+            if subset in self.results:
+                ginis[subset] = self.results[subset][0]
+        return ginis
+
+    def bound(self, subset):
+        # Gini bound of every model on the variables of a subset or of its subsets
+        subset = tuple(sorted(subset))
+        if subset not in self.bounds:
+            if self.target is None:
+                self.target = _binary_target(self.y)
+            columns = [self.predictor_cols[i] for i in subset]
+            self.bounds[subset] = _group_gini_bound(self.data[columns], self.target)
+        return self.bounds[subset]
+
+    def _time_left(self):
+        if self.time_limit is None:
+            return None
+        return max(0.0, self.time_limit - (time.time() - self.start))
+
+    def _warm_start(self, subset, parent):
+        # Coefficients of the parent subset, with zeros for the variables the parent does not contain
+        if parent is None or not self.warm_start:
+            return None, None
+        parent = tuple(sorted(parent))
+        if parent not in self.results:
+            return None, None
+        parent_model = self.results[parent][1]
+        parent_coef = dict(zip(parent, parent_model.coef_[0]))
+        init_coef = np.array([parent_coef.get(i, 0.0) for i in subset])
+        return init_coef, parent_model.intercept_[0]
+
+    def _formula(self, subset):
+        return f"{self.default_flag} ~ {' + '.join(self.predictor_cols[i] for i in subset)}"
+
+    def leaderboard(self, max_variables):
+        rows = [(subset, tuple(self.predictor_cols[i] for i in subset), self._formula(subset), len(subset), gini)
+                for subset, (gini, _) in self.results.items() if len(subset) <= max_variables]
+        board = pd.DataFrame(rows, columns=['Subset', 'Variables', 'Formula', 'Variable.Count', 'Gini'])
+        board = board.sort_values(by=['Gini', 'Variable.Count'], ascending=[False, True], kind='mergesort')
+        board = board.reset_index(drop=True)
+        board.insert(0, 'Rank', range(1, len(board) + 1))
+        return board
+
+    def batch_size(self):
+        return 64 * max(1, self.n_jobs if self.n_jobs not in (None, -1) else 8)
+
+
+def _exhaustive_search(searcher, max_variables, beam_width, top_k):
+    # Batches never mix subset sizes, so a warm-started subset always finds its parent fitted
+    p = len(searcher.predictor_cols)
+    for r in range(1, max_variables + 1):
+        size_combinations = combinations(range(p), r)
+        while not searcher.budget_exhausted():
+            batch = list(islice(size_combinations, searcher.batch_size()))
+            if not batch:
+                break
+            searcher.evaluate([(comb, comb[:-1] or None) for comb in batch])
+
+
+def _forward_search(searcher, max_variables, beam_width, top_k):
+    p = len(searcher.predictor_cols)
+    current = ()
+    current_gini = -np.inf
+    while len(current) < max_variables and not searcher.budget_exhausted():
+        candidates = [(current + (j,), current or None) for j in range(p) if j not in current]
+        ginis = searcher.evaluate(candidates)
+        if not ginis:
+            break
+        best_subset = max(ginis, key=ginis.get)
+        if ginis[best_subset] <= current_gini:
+            break
+        current, current_gini = best_subset, ginis[best_subset]
+
+
+def _backward_search(searcher, max_variables, beam_width, top_k):
+    current = tuple(range(len(searcher.predictor_cols)))
+    if not searcher.evaluate([(current, None)]):
+        return
+    while len(current) > 1 and not searcher.budget_exhausted():
+        candidates = [(tuple(i for i in current if i != j), current) for j in current]
+        ginis = searcher.evaluate(candidates)
+        if not ginis:
+            break
+        current = max(ginis, key=ginis.get)
+
+
+def _beam_search(searcher, max_variables, beam_width, top_k):
+    p = len(searcher.predictor_cols)
+    beam = [()]
+    for _ in range(max_variables):
+        if searcher.budget_exhausted():
+            break
+        candidates = {}
+        for parent in beam:
+            for j in range(p):
+                if j not in parent:
+                    candidates.setdefault(tuple(sorted(parent + (j,))), parent or None)
+        ginis = searcher.evaluate(list(candidates.items()))
+        if not ginis:
+            break
+        beam = sorted(ginis, key=ginis.get, reverse=True)[:beam_width]
+
+
+def _branch_and_bound_search(searcher, max_variables, beam_width, top_k):
+    # Variables are ordered by their univariate rank Gini, so strong subsets are found early
+    columns = searcher.predictor_cols
+    univariate = _rank_gini_matrix(searcher.data[columns].to_numpy(dtype=float), _binary_target(searcher.y))
+    order = list(np.argsort(-np.nan_to_num(univariate, nan=-np.inf), kind='mergesort'))
+
+    def kth_best():
+        ginis = [gini for subset, (gini, _) in searcher.results.items() if len(subset) <= max_variables]
+        return np.partition(ginis, len(ginis) - top_k)[len(ginis) - top_k] if len(ginis) >= top_k else -np.inf
 
+    # Each node is a subset together with the position of the next variable which may be added
+    stack = [((), 0, None)]
+    while stack and not searcher.budget_exhausted():
+        subset, position, parent = stack.pop()
+        remaining = tuple(order[position:])
+        if subset:
+            searcher.evaluate([(subset, parent)])
 
+        if remaining and len(subset) < max_variables:
+            # A branch whose bound ties the k-th best Gini is kept, so ties are resolved as in the exhaustive search
+            if searcher.bound(subset + remaining) < kth_best() - 1e-12:
+                continue
+            # Push the branches so that the one with the stronger next variable is explored first
+            for k in range(len(order) - 1, position - 1, -1):
+                stack.append((subset + (order[k],), k + 1, subset or None))
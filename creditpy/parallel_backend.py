@@ -0,0 +1,118 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+
+BACKENDS = ("serial", "threads", "processes")
+
+
+def parallel_map(func, tasks, n_jobs=1, backend=None, timeout=None):
+    """
+    Apply a function to a list of tasks with the selected execution backend.
+
+    Parameters:
+    func : callable
+        The function to apply. It must be defined at module level when the "processes" backend is used.
+    tasks : list of tuple
+        The positional arguments of each call.
+    n_jobs : int, optional
+        The number of workers. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+    timeout : float, optional
+        Time budget in seconds. Calls which have not finished when it runs out are cancelled and their result
+        is None; the serial backend stops starting new calls. Default is no limit.
+
+    Returns:
+    list
+        The results of the calls, in the same order as the tasks.
+
+    Examples:
+    parallel_map(pow, [(2, 3), (3, 2)], n_jobs=2, backend="threads")
+    """
+    tasks = list(tasks)
+    backend, workers = _resolve_backend(n_jobs, backend, len(tasks))
+
+    if backend == "serial":
+        if timeout is None:
+            return [func(*task) for task in tasks]
+        deadline = time.monotonic() + timeout
+        return [func(*task) if time.monotonic() < deadline else None for task in tasks]
+
+    executor_class = ThreadPoolExecutor if backend == "threads" else ProcessPoolExecutor
+    if timeout is None:
+        with executor_class(max_workers=workers) as executor:
+            futures = [executor.submit(func, *task) for task in tasks]
+            return [future.result() for future in futures]
+
+    executor = executor_class(max_workers=workers)
+    futures = [executor.submit(func, *task) for task in tasks]
+    wait(futures, timeout=timeout)
+    # Calls which are still running finish in the background; queued calls are cancelled
+    executor.shutdown(wait=False, cancel_futures=True)
+    return [future.result() if future.done() and not future.cancelled() else None for future in futures]
+
+
+def column_block_apply(func, frames, columns, args=(), shared_columns=None, n_jobs=1, backend=None):
+    """
+    Split columns into blocks and apply a column-wise function to each block with the selected execution backend.
+
+    Every worker only receives the block's columns of each frame, together with the shared columns
+    (for example the default flag) which every block needs.
+
+    Parameters:
+    func : callable
+        Called as func(block_frames, block_columns, *args). It must return one result per column of the block
+        and be defined at module level when the "processes" backend is used.
+    frames : list of pandas DataFrame
+        The frames from which the columns are taken.
+    columns : list
+        The columns to process.
+    args : tuple, optional
+        Additional positional arguments passed to func.
+    shared_columns : list, optional
+        Columns shipped to every block.
+    n_jobs : int, optional
+        The number of workers. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+
+    Returns:
+    list
+        One result per column, in the same order as the columns.
+    """
+    columns = list(columns)
+    shared_columns = list(shared_columns) if shared_columns is not None else []
+    backend, workers = _resolve_backend(n_jobs, backend, len(columns))
+
+    if backend == "serial":
+        return list(func(frames, columns, *args))
+
+    tasks = []
+    for block in np.array_split(np.arange(len(columns)), workers):
+        block_columns = [columns[i] for i in block]
+        needed = set(block_columns) | set(shared_columns)
+        block_frames = [frame[[column for column in frame.columns if column in needed]] for frame in frames]
+        tasks.append((block_frames, block_columns) + tuple(args))
+
+    results = []
+    for block_result in parallel_map(func, tasks, n_jobs=workers, backend=backend):
+        results.extend(block_result)
+    return results
+
+
+def _resolve_backend(n_jobs, backend, n_tasks):
+    # Turn the n_jobs / backend options into a backend name and a worker count
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer, None or -1, got {n_jobs}.")
+    if backend is None:
+        backend = "serial" if n_jobs == 1 else "processes"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+
+    workers = max(1, min(n_jobs, n_tasks))
+    if backend == "serial" or workers == 1:
+        return "serial", 1
+    return backend, workers
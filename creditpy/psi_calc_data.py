@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
+from creditpy.stats_cache import _cached_column_apply
+from creditpy.psi_monitor import PSIBaseline
 
-def PSI_calc_data(main_data, second_data, bins, default_flag):
+def PSI_calc_data(main_data, second_data, bins, default_flag, n_jobs=1, backend=None, cache=None):
     """
     Calculate the PSI (Population Stability Index) for each binned variable in the datasets.
 
@@ -9,32 +11,35 @@ def PSI_calc_data(main_data, second_data, bins, default_flag):
     - main_data (pandas.DataFrame): The main dataset.
     - second_data (pandas.DataFrame): The second dataset.
     - bins (dict or int): A dictionary containing the binning information for each variable,
-                          or the number of bins to use for binning.
+                          or the number of bins to use for binning. Integer bins take their edges
+                          from the main dataset and apply them to both datasets.
     - default_flag (str): The default flag variable to exclude from the calculation.
+    - n_jobs (int, optional): The number of workers. None or -1 uses all CPU cores. Default is 1.
+    - backend (str, optional): "serial", "threads" or "processes". Default is "serial" for a single worker
+                               and "processes" otherwise.
+    - cache (StatsCache, optional): Cache of the PSI of every variable. Variables whose values in both datasets
+                                    and bins are unchanged are not binned again. Default is None.
 
     Returns:
     pandas.DataFrame: A DataFrame containing the binned variables and their corresponding PSI values.
     """
-    def calculate_psi(data1, data2, variable, bins):
-        if isinstance(bins, int):
-            y = pd.cut(data1[variable], bins=bins, include_lowest=True, right=True).value_counts(normalize=True)
-            u = pd.cut(data2[variable], bins=bins, include_lowest=True, right=True).value_counts(normalize=True)
-        else:
-            y = pd.cut(data1[variable], bins=bins[variable], include_lowest=True, right=True).value_counts(normalize=True)
-            u = pd.cut(data2[variable], bins=bins[variable], include_lowest=True, right=True).value_counts(normalize=True)
-        merged = pd.merge(left=y, right=u, how='outer', left_index=True, right_index=True)
-        merged['percenty'] = merged.iloc[:, 1].fillna(0)
-        merged['percentx'] = merged.iloc[:, 0].fillna(0)
-        merged['SSI'] = (merged['percentx'] - merged['percenty']) * np.log(merged['percentx'] / merged['percenty'])
-        # Handle division by zero
-        merged['SSI'] = np.where(merged['percenty'] == 0, 0, merged['SSI'])
-        psi = abs(merged['SSI'].sum()) * 100
-        return psi
+    variables = [variable for variable in main_data.columns if variable != default_flag]
+    if not isinstance(bins, int):
+        bins = {variable: bins[variable] for variable in variables}
 
-    psi_values = {}
-    for variable in main_data.columns:
-        if variable != default_flag:
-            psi_values[variable] = calculate_psi(main_data, second_data, variable, bins)
+    psi_values = _cached_column_apply(cache, "psi", _psi_block, [main_data, second_data], variables, args=(bins,),
+                                      params=bins if isinstance(bins, int) else None,
+                                      column_params=None if isinstance(bins, int) else
+                                      {variable: repr(np.asarray(bins[variable]).tolist()) for variable in variables},
+                                      n_jobs=n_jobs, backend=backend)
 
-    psi_df = pd.DataFrame(list(psi_values.items()), columns=['Variable', 'PSI'])
+    psi_df = pd.DataFrame({'Variable': variables, 'PSI': psi_values})
     return psi_df
+
+
+def _psi_block(frames, columns, bins):
+    # PSI values of a block of columns; integer bins take their edges from the main dataset
+    data1, data2 = frames
+    baseline = PSIBaseline.fit(data1[columns], bins)
+    accumulator = baseline.accumulator().update(data2)
+    return list(baseline.psi(accumulator)['PSI'])
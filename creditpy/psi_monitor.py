@@ -0,0 +1,179 @@
+import json
+import pandas as pd
+import numpy as np
+from creditpy.woe_binning_chunked import _bin_codes
+
+
+class PSIBaseline:
+    """
+    Persisted baseline profile for PSI (Population Stability Index) monitoring.
+
+    The profile stores the bin edges and the proportions of every variable in the development (main)
+    dataset. Current data is counted into PSIAccumulator objects which can be merged across partitions,
+    workers and days, and the PSI is computed from the counts in O(bins) without rescanning either
+    population. Bins are right-closed and the first bin includes its left edge, as pd.cut with
+    include_lowest=True in PSI_calc_data. The outer edges are open: values below the first edge or above the
+    last edge are counted in the first or last bin, so shifts beyond the baseline range raise the PSI.
+
+    Parameters:
+    edges : dict
+        Bin edges per variable.
+    proportions : dict
+        Baseline proportion of every bin per variable.
+
+    Examples:
+    >>> baseline = PSIBaseline.fit(development_data, bins=10, default_flag="creditability")
+    >>> baseline.save("baseline.json")
+    >>> accumulator = PSIBaseline.load("baseline.json").accumulator()
+    >>> for partition in partitions:
+    ...     accumulator.update(partition)
+    >>> baseline.psi(accumulator)
+    """
+
+    def __init__(self, edges, proportions):
+        self.edges = {variable: np.asarray(edge, dtype=float) for variable, edge in edges.items()}
+        self.proportions = {variable: np.asarray(proportion, dtype=float)
+                            for variable, proportion in proportions.items()}
+
+    @classmethod
+    def fit(cls, data, bins, default_flag=None):
+        """
+        Build the baseline profile from the main dataset.
+
+        Parameters:
+        data : pandas DataFrame
+            The main (development) dataset.
+        bins : dict or int
+            A dictionary containing the bin edges for each variable, or the number of equal-width bins,
+            whose edges are taken from the main dataset as pd.cut does.
+        default_flag : str, optional
+            The default flag variable to exclude.
+
+        Returns:
+        PSIBaseline
+            The baseline profile.
+        """
+        edges = {}
+        proportions = {}
+        for variable in data.columns:
+            if variable == default_flag:
+                continue
+            values = data[variable].to_numpy(dtype=float)
+            if isinstance(bins, int):
+                _, edge = pd.cut(values, bins=bins, include_lowest=True, right=True, retbins=True)
+            else:
+                edge = np.asarray(bins[variable], dtype=float)
+            counts = _bin_counts(values, edge)
+            edges[variable] = edge
+            proportions[variable] = counts / counts.sum() if counts.sum() > 0 else counts
+        return cls(edges, proportions)
+
+    def accumulator(self):
+        """Return an empty accumulator for current data with the bins of this baseline."""
+        return PSIAccumulator(self.edges)
+
+    def psi(self, accumulator):
+        """
+        Calculate the PSI of every variable from the counts of an accumulator.
+        The PSI is NaN for a variable without any non-missing current value.
+
+        Returns:
+        pandas.DataFrame: A DataFrame containing the variables and their corresponding PSI values.
+        """
+        psi_values = []
+        for variable, percentx in self.proportions.items():
+            counts = accumulator.counts[variable]
+            total = counts.sum()
+            if total == 0:
+                psi_values.append(np.nan)
+                continue
+            psi_values.append(_psi(percentx, counts / total))
+        return pd.DataFrame({'Variable': list(self.proportions), 'PSI': psi_values})
+
+    def to_dict(self):
+        return {
+            'edges': {variable: edge.tolist() for variable, edge in self.edges.items()},
+            'proportions': {variable: proportion.tolist() for variable, proportion in self.proportions.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, profile):
+        return cls(profile['edges'], profile['proportions'])
+
+    def save(self, path):
+        """Save the baseline profile as a JSON file."""
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path):
+        """Load a baseline profile saved with save."""
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+class PSIAccumulator:
+    """
+    Per-bin counts of current data for PSI monitoring, mergeable across partitions, workers and days.
+
+    Parameters:
+    edges : dict
+        Bin edges per variable, normally those of a PSIBaseline.
+    """
+
+    def __init__(self, edges):
+        self.edges = {variable: np.asarray(edge, dtype=float) for variable, edge in edges.items()}
+        self.counts = {variable: np.zeros(len(edge) - 1) for variable, edge in self.edges.items()}
+
+    def update(self, data):
+        """Count a partition of current data. Variables which are not in the baseline are ignored."""
+        for variable, edge in self.edges.items():
+            self.counts[variable] += _bin_counts(data[variable].to_numpy(dtype=float), edge)
+        return self
+
+    def merge(self, other):
+        """Add the counts of another accumulator with the same bins."""
+        for variable, counts in other.counts.items():
+            if not np.array_equal(self.edges[variable], other.edges[variable]):
+                raise ValueError(f"The accumulators have different bins for variable '{variable}'.")
+            self.counts[variable] += counts
+        return self
+
+    def __add__(self, other):
+        merged = PSIAccumulator(self.edges)
+        return merged.merge(self).merge(other)
+
+    def to_dict(self):
+        return {
+            'edges': {variable: edge.tolist() for variable, edge in self.edges.items()},
+            'counts': {variable: counts.tolist() for variable, counts in self.counts.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        accumulator = cls(state['edges'])
+        for variable, counts in state['counts'].items():
+            accumulator.counts[variable] = np.asarray(counts, dtype=float)
+        return accumulator
+
+
+def _bin_counts(values, edges):
+    # Number of values in every bin; missing values are not counted
+    codes = _open_bin_codes(values, edges)
+    return np.bincount(codes[codes >= 0], minlength=len(edges) - 1).astype(float)
+
+
+def _open_bin_codes(values, edges):
+    # Bin codes of _bin_codes with open outer edges: values beyond them go to the first or last bin
+    codes = _bin_codes(values, edges)
+    codes[values < edges[0]] = 0
+    codes[values > edges[-1]] = len(edges) - 2
+    return codes
+
+
+def _psi(percentx, percenty):
+    # Same formula as PSI_calc_data: bins empty in the current data contribute nothing
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = (percentx - percenty) * np.log(percentx / percenty)
+    terms = np.where(percenty == 0, 0, terms)
+    return abs(np.nansum(terms)) * 100
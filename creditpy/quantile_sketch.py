@@ -0,0 +1,110 @@
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded memory.
+
+    The sketch keeps a stack of compactors as in the KLL sketch: level h holds items which each stand for
+    2**h observations. When a level exceeds its capacity it is sorted and every second item is promoted to
+    the next level. Memory is O(k log(n / k)) items regardless of the number of observations, sketches of
+    separate chunks can be merged, and each compaction adds at most 2**h to the rank error, so the sketch
+    reports a guaranteed bound on the rank error of its quantiles.
+
+    Parameters:
+    k : int, optional
+        Capacity of the top compactor. Larger values give a smaller error. Default is 200.
+    seed : int, optional
+        Seed for the random offsets of the compactions.
+
+    Examples:
+    sketch = QuantileSketch(k=200)
+    for chunk in chunks:
+        sketch.update(chunk['credit.amount'])
+    sketch.quantile([0.1, 0.5, 0.9])
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.missing = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.error = 0.0  # upper bound on the absolute rank error
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Add a batch of values to the sketch. Missing values are counted separately and not sketched."""
+        values = np.asarray(values, dtype=float).ravel()
+        missing = np.isnan(values)
+        self.missing += int(missing.sum())
+        values = values[~missing]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merge another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self.missing += other.missing
+        self.min = np.nanmin([self.min, other.min])
+        self.max = np.nanmax([self.max, other.max])
+        self.error += other.error
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Approximate quantiles, interpolated linearly between ranks as in numpy.quantile.
+
+        Without any compaction the result equals numpy.quantile of the sketched values.
+        """
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items_h), 2.0 ** h) for h, items_h in enumerate(self.levels)])
+        order = np.argsort(items, kind='mergesort')
+        items = items[order]
+        weights = weights[order]
+
+        # Each item stands for a block of consecutive ranks; use the centre of the block
+        ranks = np.cumsum(weights) - weights + (weights - 1) / 2
+        result = np.interp(q * (self.count - 1), ranks, items)
+        result = np.where(q <= 0, self.min, result)
+        result = np.where(q >= 1, self.max, result)
+        return result
+
+    def rank_error(self):
+        """Guaranteed upper bound on the rank error of the quantiles, as a fraction of the observations."""
+        return self.error / self.count if self.count else 0.0
+
+    def _capacity(self, h):
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (len(self.levels) - 1 - h))))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(self.levels[h])
+                # An odd item stays at its level so that no weight is lost
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                offset = self._rng.integers(2)
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], pairs[offset::2]])
+                self.levels[h] = keep
+                self.error += 2.0 ** h
+            h += 1
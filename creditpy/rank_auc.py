@@ -0,0 +1,145 @@
+import pandas as pd
+import numpy as np
+
+
+def rank_auc(scores, actual):
+    """
+    Calculate the Area Under the ROC Curve (AUC) from the ranks of the scores.
+
+    The AUC is computed as the Mann-Whitney statistic with midranks, so tied scores are counted as half,
+    exactly as in roc_auc_score. Observations with a missing score or a missing actual value are left out.
+
+    Parameters:
+    scores : array-like
+        Scores or predicted values. Higher values indicate a higher probability of the positive class.
+    actual : array-like
+        Actual values. The greater of the two classes is taken as the positive class.
+
+    Returns:
+    float:
+        AUC value. NaN if one of the classes is missing.
+
+    Examples:
+    rank_auc([0.1, 0.4, 0.35, 0.8], [0, 0, 1, 1])
+    """
+    scores = np.asarray(scores, dtype=float)
+    target = _binary_target(actual)
+    valid = ~np.isnan(scores) & ~np.isnan(target)
+    scores = scores[valid]
+    target = target[valid]
+
+    order = np.argsort(scores, kind='mergesort')
+    return _sorted_auc(scores[order], target[order])
+
+
+def _binary_target(actual):
+    # Encode the actual values as 1.0 for the greater class, 0.0 for the other one and NaN when missing
+    actual = pd.Series(np.asarray(actual))
+    target = np.full(len(actual), np.nan)
+    known = actual.notna().to_numpy()
+    classes = np.unique(actual[known])
+    if len(classes) > 2:
+        raise ValueError(f"Only binary targets are supported, found classes {list(classes)}.")
+    if len(classes) > 0:
+        target[known] = (actual[known] == classes[-1]).to_numpy(dtype=float)
+    return target
+
+
+def _sorted_auc(sorted_scores, sorted_target):
+    # AUC of scores which are already sorted ascending and contain no missing values
+    n = len(sorted_scores)
+    n_pos = sorted_target.sum()
+    n_neg = n - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return np.nan
+
+    # Midrank of every tie group: the ranks start + 1 ... end are averaged
+    start = np.flatnonzero(np.r_[True, sorted_scores[1:] != sorted_scores[:-1]])
+    end = np.r_[start[1:], n]
+    midranks = (start + end + 1) / 2
+    pos_in_group = np.add.reduceat(sorted_target, start)
+
+    rank_sum = np.dot(midranks, pos_in_group)
+    return (rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+
+
+def _rank_gini_matrix(values, target, intercept_penalty=None):
+    # Signed rank Gini of every column of a 2-D array against a 0/1 target.
+    # The sign is the sign of the coefficient of a univariate logistic regression, which follows the score
+    # sum((y - p0) * x) at the intercept-only fit p0, so the result equals the Gini of its fitted values.
+    # intercept_penalty is the C of a solver which also penalizes the intercept, such as liblinear.
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(values, axis=0, kind='mergesort')  # missing values are sorted last
+    ginis = np.full(values.shape[1], np.nan)
+
+    for j in range(values.shape[1]):
+        column = values[order[:, j], j]
+        column_target = target[order[:, j]]
+        valid = ~np.isnan(column) & ~np.isnan(column_target)
+        column = column[valid]
+        column_target = column_target[valid]
+
+        auc = _sorted_auc(column, column_target)
+        if np.isnan(auc):
+            continue
+        p0 = _intercept_only_probability(column_target, intercept_penalty)
+        direction = np.sign(np.dot(column_target - p0, column))
+        ginis[j] = direction * (2 * auc - 1)
+
+    return ginis
+
+
+def _intercept_only_probability(target, intercept_penalty=None):
+    # Fitted probability of a logistic regression with only an intercept
+    n_pos = target.sum()
+    if intercept_penalty is None:
+        return n_pos / len(target)
+
+    # Newton iterations for c = C * sum(y - sigmoid(c)) when the intercept carries an L2 penalty
+    intercept = 0.0
+    for _ in range(50):
+        p = 1 / (1 + np.exp(-intercept))
+        step = (intercept - intercept_penalty * (n_pos - len(target) * p)) / (
+            1 + intercept_penalty * len(target) * p * (1 - p))
+        intercept -= step
+        if abs(step) < 1e-12:
+            break
+    return 1 / (1 + np.exp(-intercept))
+
+
+def _grouped_auc(scores, target, codes, n_groups):
+    # AUC of every group from a single sort by (group, score). codes holds the group of every observation
+    # (0 ... n_groups - 1, negative to leave it out). Groups with only one class get NaN.
+    scores = np.asarray(scores, dtype=float)
+    valid = (codes >= 0) & ~np.isnan(scores) & ~np.isnan(target)
+    scores = scores[valid]
+    target = target[valid]
+    codes = codes[valid]
+
+    # Sort by score, then stably by group; the stable sort of small integer codes is a radix sort
+    order = np.argsort(scores)
+    code_dtype = np.int16 if n_groups <= np.iinfo(np.int16).max else np.int64
+    order = order[np.argsort(codes[order].astype(code_dtype), kind='stable')]
+    scores = scores[order]
+    target = target[order]
+    codes = codes[order]
+    n = len(scores)
+
+    n_obs = np.bincount(codes, minlength=n_groups)
+    n_pos = np.bincount(codes, weights=target, minlength=n_groups)
+    n_neg = n_obs - n_pos
+    group_start = np.cumsum(n_obs) - n_obs
+
+    # Tie groups never span two groups, so midranks within a group follow from the global positions
+    new_tie = np.r_[True, (scores[1:] != scores[:-1]) | (codes[1:] != codes[:-1])] if n else np.empty(0, bool)
+    start = np.flatnonzero(new_tie)
+    end = np.r_[start[1:], n]
+    tie_codes = codes[start]
+    midranks = (start + end + 1) / 2 - group_start[tie_codes]
+    pos_in_tie = np.add.reduceat(target, start) if n else np.empty(0)
+
+    rank_sum = np.bincount(tie_codes, weights=midranks * pos_in_tie, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        auc = (rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+    auc[(n_pos == 0) | (n_neg == 0)] = np.nan
+    return auc
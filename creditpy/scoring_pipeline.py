@@ -0,0 +1,188 @@
+import time
+import pandas as pd
+import numpy as np
+from creditpy.woe_binning_chunked import _iter_chunks
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class ScoringPipeline:
+    """
+    Compiled batch scoring pipeline: WOE -> GLM -> calibration -> scaled score -> rating grade.
+
+    The steps done today with woe_binning, model.predict_proba, regression_calibration, scaled_score and
+    master_scale are fused into one vectorized kernel per chunk. The WOE matrix is written into a float32
+    array, the logit is accumulated column by column, the calibrated logit is a linear function of it, the
+    scaled score is a linear function of the calibrated logit and the grade is found with searchsorted
+    on the master scale. No intermediate DataFrame is built.
+
+    Parameters:
+    woe_transformer : WoeTransformer
+        The fitted WOE transformer.
+    model : sklearn.linear_model.LogisticRegression
+        The model fitted on the WOE variables.
+    calibration_model : sklearn.linear_model.LogisticRegression, optional
+        The 'calibration_model' returned by regression_calibration. Default is no calibration.
+    ceiling_score : float, optional
+        The ceiling score of scaled_score. The scaled score is produced only if it is given with increase.
+    increase : float, optional
+        The increase level of scaled_score.
+    master_scale : pandas DataFrame, optional
+        The output of master_scale. Its 'Final.PD.Range' intervals define the grades 1, 2, ...
+    keep_columns : list, optional
+        Input columns, such as the account id, copied to the output.
+
+    Examples:
+    >>> transformer = WoeTransformer().fit(train, "creditability")
+    >>> pipeline = ScoringPipeline(transformer, model, calibration['calibration_model'], 1000, 15,
+    ...                            master_scale_data, keep_columns=['ID'])
+    >>> report = pipeline.score_file('accounts.csv', 'scores.csv', chunksize=500000)
+    """
+
+    def __init__(self, woe_transformer, model, calibration_model=None, ceiling_score=None, increase=None,
+                 master_scale=None, keep_columns=None):
+        self.woe_transformer = woe_transformer
+        self.model = model
+        self.calibration_model = calibration_model
+        self.ceiling_score = ceiling_score
+        self.increase = increase
+        self.master_scale = master_scale
+        self.keep_columns = list(keep_columns) if keep_columns is not None else []
+
+        # Model coefficients in the column order of the WOE matrix
+        coef = np.asarray(model.coef_, dtype=float).ravel()
+        self.coef = np.zeros(len(woe_transformer.columns_))
+        if hasattr(model, 'feature_names_in_'):
+            positions = {column + suffix: j for j, column in enumerate(woe_transformer.columns_)
+                         for suffix in ('_bin', '')}
+            missing = [name for name in model.feature_names_in_ if name not in positions]
+            if missing:
+                raise ValueError(f"Model features {missing} are not variables of the WOE transformer.")
+            for name, value in zip(model.feature_names_in_, coef):
+                self.coef[positions[name]] = value
+        elif len(coef) == len(self.coef):
+            self.coef[:] = coef
+        else:
+            raise ValueError("The model has no feature names and a different number of features than the "
+                             "WOE transformer.")
+        self.intercept = float(np.ravel(model.intercept_)[0])
+        self.used = np.flatnonzero(self.coef)
+
+        if calibration_model is not None:
+            self.calibration_slope = float(np.ravel(calibration_model.coef_)[0])
+            self.calibration_intercept = float(np.ravel(calibration_model.intercept_)[0])
+        else:
+            self.calibration_slope, self.calibration_intercept = 1.0, 0.0
+
+        self.scaled = ceiling_score is not None and increase is not None
+        if self.scaled:
+            self.factor = increase / np.log(2)
+            self.offset = ceiling_score - self.factor * np.log(increase)
+
+        if master_scale is not None:
+            ranges = pd.IntervalIndex(master_scale['Final.PD.Range'])
+            self.grade_edges = np.sort(ranges.right.to_numpy(dtype=float))
+
+    def score_chunk(self, df):
+        """
+        Score one chunk.
+
+        Parameters:
+        df : pandas DataFrame
+            The raw input variables.
+
+        Returns:
+        pandas DataFrame
+            The keep_columns followed by PD, calibrated_pd, scaled_score and grade.
+        """
+        woe = self.woe_transformer.transform_array(df)
+
+        logit = np.full(len(df), self.intercept)
+        for j in self.used:
+            logit += self.coef[j] * woe[:, j]
+
+        output = {column: df[column].to_numpy() for column in self.keep_columns}
+        output['PD'] = _sigmoid(logit)
+
+        calibrated_logit = self.calibration_intercept + self.calibration_slope * logit
+        output['calibrated_pd'] = _sigmoid(calibrated_logit) if self.calibration_model is not None \
+            else output['PD']
+        if self.scaled:
+            # log((1 - PD) / PD) is the negative logit
+            output['scaled_score'] = self.offset - self.factor * calibrated_logit
+        if self.master_scale is not None:
+            grade = np.searchsorted(self.grade_edges, output['calibrated_pd'], side='left') + 1
+            output['grade'] = np.minimum(grade, len(self.grade_edges))
+
+        return pd.DataFrame(output, index=df.index)
+
+    def score_file(self, input_path, output_path, chunksize=100000, file_format=None, verbose=True):
+        """
+        Score a CSV or Parquet file chunk by chunk and write the scores to a CSV or Parquet file.
+
+        Parameters:
+        input_path : str
+            The CSV or Parquet file to score.
+        output_path : str
+            The output file. It is written as Parquet if it ends with .parquet or .pq, else as CSV.
+        chunksize : int, optional
+            The number of rows per chunk. Default is 100000.
+        file_format : str, optional
+            "csv" or "parquet" for the input. By default it is inferred from the file extension.
+        verbose : bool, optional
+            Print the throughput and memory of every chunk. Default is True.
+
+        Returns:
+        pandas DataFrame
+            Rows, seconds, rows per second, working memory of the chunk and peak process memory per chunk.
+        """
+        parquet_output = output_path.lower().endswith((".parquet", ".pq"))
+        writer = None
+        report = []
+        chunks = _iter_chunks(input_path, chunksize, file_format)
+        number = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                break
+            scores = self.score_chunk(chunk)
+
+            if parquet_output:
+                try:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                except ImportError:
+                    raise ImportError("Writing Parquet files requires the pyarrow package.")
+                table = pa.Table.from_pandas(scores, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                scores.to_csv(output_path, mode='w' if number == 0 else 'a', header=number == 0, index=False)
+
+            seconds = time.perf_counter() - start
+            number += 1
+            chunk_memory = (chunk.memory_usage(deep=True).sum() + scores.memory_usage(deep=True).sum()
+                            + len(chunk) * len(self.woe_transformer.columns_) * np.dtype(
+                                self.woe_transformer.dtype).itemsize) / 2 ** 20
+            peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10 if resource else np.nan
+            report.append([number, len(chunk), seconds, len(chunk) / seconds if seconds > 0 else np.inf,
+                           chunk_memory, peak_memory])
+            if verbose:
+                print(f"Chunk {number}: {len(chunk)} rows, {len(chunk) / seconds:,.0f} rows/s, "
+                      f"chunk memory {chunk_memory:.1f} MB, peak memory {peak_memory:.1f} MB")
+
+        if writer is not None:
+            writer.close()
+
+        return pd.DataFrame(report, columns=['Chunk', 'Rows', 'Seconds', 'Rows.Per.Second', 'Chunk.Memory.MB',
+                                             'Peak.Memory.MB'])
+
+
+def _sigmoid(x):
+    return 1 / (1 + np.exp(-x))
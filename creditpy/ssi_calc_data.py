@@ -1,35 +1,80 @@
 import pandas as pd
 import numpy as np
+from creditpy.parallel_backend import column_block_apply
 
-def SSI_calc_data(main_data, second_data, default_flag):
+def SSI_calc_data(main_data, second_data, default_flag, smoothing=None, rare_threshold=None, n_jobs=1,
+                  backend=None):
     """
     Calculate the SSI for each variable in the datasets.
 
+    The levels of each variable are encoded against one category dictionary shared by both datasets and
+    counted with bincount, so time and memory grow with the number of levels and high-cardinality
+    variables such as branch codes, postcodes or merchant IDs are handled without merging value counts.
+    Missing values are not counted.
+
     Parameters:
     - main_data (pandas.DataFrame): The main dataset.
     - second_data (pandas.DataFrame): The second dataset.
     - default_flag (str): The default flag variable to exclude from the calculation.
+    - smoothing (float, optional): Pseudo-count added to every level in both datasets, so that a level seen
+                                   in only one dataset gives a finite SSI. Default is None, no smoothing,
+                                   where such a level makes the SSI infinite.
+    - rare_threshold (float, optional): Levels whose share is below this value in both datasets are folded
+                                        into a single "other" level. Default is None, no folding.
+    - n_jobs (int, optional): The number of workers. None or -1 uses all CPU cores. Default is 1.
+    - backend (str, optional): "serial", "threads" or "processes". Default is "serial" for a single worker
+                               and "processes" otherwise.
 
     Returns:
     pandas.DataFrame: A DataFrame containing the variables and their corresponding SSIs.
     """
-    def calculate_ssi(data1, data2, variable):
-        y = data1[variable].value_counts(normalize=True)
-        u = data2[variable].value_counts(normalize=True)
-        merged = pd.merge(left=y, right=u, how='outer', left_index=True, right_index=True)
-        merged['percenty'] = merged.iloc[:, 1].fillna(0)
-        merged['percentx'] = merged.iloc[:, 0].fillna(0)
-        merged['SSI'] = (merged['percentx'] - merged['percenty']) * np.log(merged['percentx'] / merged['percenty'])
-        return merged['SSI'].sum()
-
-    ssi_values = {}
-    for variable in main_data.columns:
-        if variable != default_flag:
-            ssi_values[variable] = calculate_ssi(main_data, second_data, variable)
-
-    ssi_df = pd.DataFrame(list(ssi_values.items()), columns=['Variable', 'SSI'])
+    variables = [variable for variable in main_data.columns if variable != default_flag]
+    ssi_values = column_block_apply(_ssi_block, [main_data, second_data], variables,
+                                    args=(smoothing, rare_threshold), n_jobs=n_jobs, backend=backend)
+
+    ssi_df = pd.DataFrame({'Variable': variables, 'SSI': ssi_values})
     return ssi_df
 
+
+def _ssi_block(frames, columns, smoothing=None, rare_threshold=None):
+    # SSI values of a block of columns
+    data1, data2 = frames
+    return [_calculate_ssi(data1, data2, variable, smoothing, rare_threshold) for variable in columns]
+
+
+def _calculate_ssi(data1, data2, variable, smoothing=None, rare_threshold=None):
+    countx, county = _level_counts(data1[variable], data2[variable])
+    if len(countx) == 0:
+        return 0.0
+
+    if rare_threshold is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rare = (countx / countx.sum() < rare_threshold) & (county / county.sum() < rare_threshold)
+        if rare.any():
+            countx = np.r_[countx[~rare], countx[rare].sum()]
+            county = np.r_[county[~rare], county[rare].sum()]
+
+    if smoothing is not None:
+        countx = countx + smoothing
+        county = county + smoothing
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentx = countx / countx.sum()
+        percenty = county / county.sum()
+        ssi = (percentx - percenty) * np.log(percentx / percenty)
+    return ssi.sum()
+
+
+def _level_counts(values1, values2):
+    # Counts of every level in both datasets, with the levels encoded against one shared dictionary
+    codes, levels = pd.factorize(pd.concat([values1, values2], ignore_index=True))
+    n_levels = len(levels)
+    codes1 = codes[:len(values1)]
+    codes2 = codes[len(values1):]
+    countx = np.bincount(codes1[codes1 >= 0], minlength=n_levels).astype(float)
+    county = np.bincount(codes2[codes2 >= 0], minlength=n_levels).astype(float)
+    return countx, county
+
 # Example usage:
 # Assuming main_data and second_data are your datasets, and default_flag is the column to exclude
 # ssi_result = SSI_calc_data(main_data, second_data, default_flag)
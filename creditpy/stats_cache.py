@@ -0,0 +1,161 @@
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+import pandas as pd
+import numpy as np
+from creditpy.parallel_backend import column_block_apply
+
+_MISSING = object()
+
+
+class StatsCache:
+    """
+    Opt-in cache of per-column statistics, shared across calls of IV_calc_data, Gini_univariate_data,
+    PSI_calc_data and woe_binning.
+
+    Entries are keyed by a BLAKE2b hash of the column's values, the values of the default flag, the column name
+    and the parameters of the statistic, so a column is only scanned again when its data or the parameters change.
+    Entries are evicted in least-recently-used order when the total size of their pickled values exceeds
+    max_bytes. With a spill directory, evicted entries are written there and read back on the next request.
+
+    Parameters:
+    max_bytes : int, optional
+        Memory cap of the cached values in bytes. Default is 256 MB.
+    spill_dir : str, optional
+        Directory of the on-disk store for evicted entries. Default is None, evicted entries are discarded.
+
+    Examples:
+    >>> cache = StatsCache(max_bytes=512 * 2 ** 20, spill_dir="stats_cache")
+    >>> iv_table = IV_calc_data(train, "creditability", verbose=False, cache=cache)
+    >>> gini_table = Gini_univariate_data(train, "creditability", method="rank", cache=cache)
+    >>> cache.stats()
+    """
+
+    def __init__(self, max_bytes=256 * 2 ** 20, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value of a key, reading it back from the spill directory if it was evicted."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(self._entries[key])
+
+        path = self._spill_path(key)
+        if path is not None and os.path.exists(path):
+            with open(path, 'rb') as file:
+                payload = file.read()
+            os.remove(path)
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, payload)
+            return pickle.loads(payload)
+
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entries above the memory cap."""
+        self._store(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def stats(self):
+        """Return the hit and miss counters, the number of entries and the memory in use."""
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes
+        }
+
+    def clear(self, disk=True):
+        """Remove every entry from memory and, unless disk is False, from the spill directory."""
+        self._entries.clear()
+        self.current_bytes = 0
+        if disk and self.spill_dir is not None:
+            for name in os.listdir(self.spill_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.spill_dir, name))
+
+    def __contains__(self, key):
+        path = self._spill_path(key)
+        return key in self._entries or (path is not None and os.path.exists(path))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _store(self, key, payload):
+        if key in self._entries:
+            self.current_bytes -= len(self._entries.pop(key))
+        self._entries[key] = payload
+        self.current_bytes += len(payload)
+        while self.current_bytes > self.max_bytes and self._entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+            self.evictions += 1
+            if self.spill_dir is not None:
+                with open(self._spill_path(evicted_key), 'wb') as file:
+                    file.write(evicted)
+
+    def _spill_path(self, key):
+        return None if self.spill_dir is None else os.path.join(self.spill_dir, key + '.pkl')
+
+
+def _column_hash(values):
+    # BLAKE2b digest of the values of a column; object columns are hashed through pandas' row hashes
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(series.dtype).encode())
+    if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype) or \
+            not isinstance(series.dtype, np.dtype):
+        array = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    else:
+        array = np.ascontiguousarray(series.to_numpy())
+    digest.update(array.view(np.uint8).data)
+    return digest.hexdigest()
+
+
+def _cache_key(kind, column, parts, params):
+    # Key of a statistic of a column from the hashes of its data and a repr of its parameters
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((kind, str(column), tuple(parts), params)).encode())
+    return digest.hexdigest()
+
+
+def _cached_column_apply(cache, kind, func, frames, columns, args=(), shared_columns=None, params=None,
+                         column_params=None, n_jobs=1, backend=None):
+    # column_block_apply which takes the results of unchanged columns from the cache and computes the rest
+    columns = list(columns)
+    shared_columns = list(shared_columns) if shared_columns is not None else []
+    if cache is None:
+        return column_block_apply(func, frames, columns, args=args, shared_columns=shared_columns,
+                                  n_jobs=n_jobs, backend=backend)
+
+    shared = [_column_hash(frame[column]) for frame in frames for column in shared_columns if column in frame]
+    keys = []
+    for column in columns:
+        parts = [_column_hash(frame[column]) for frame in frames] + shared
+        column_param = column_params[column] if column_params is not None else None
+        keys.append(_cache_key(kind, column, parts, (params, column_param)))
+
+    results = [cache.get(key, _MISSING) for key in keys]
+    missing = [position for position, result in enumerate(results) if result is _MISSING]
+
+    if missing:
+        computed = column_block_apply(func, frames, [columns[position] for position in missing], args=args,
+                                      shared_columns=shared_columns, n_jobs=n_jobs, backend=backend)
+        for position, result in zip(missing, computed):
+            cache.put(keys[position], result)
+            results[position] = result
+    return results
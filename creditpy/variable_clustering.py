@@ -1,22 +1,41 @@
 import pandas as pd
 import numpy as np
 from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
-from gap_statistic import OptimalK
+from creditpy.parallel_backend import parallel_map
 
 
-def variable_clustering(data, default_flag, cluster_number="optimal"):
+def variable_clustering(data, default_flag, cluster_number="optimal", sample_size=10000, sketch="subsample",
+                        projection_size=256, n_references=10, time_limit=None, seed=None, n_jobs=1, backend=None):
     """
     Perform variable clustering for a given dataset.
 
     This function clusters variables in the dataset based on the specified default flag.
     The number of clusters can be determined optimally using the gap statistic method or manually.
 
+    The gap statistic is computed in variable space, where every variable is a point, as in the final clustering.
+    Each variable is represented by a row subsample or by a random-projection sketch of all rows, so the search
+    cost does not grow with the number of observations. The reference datasets of every k are drawn in one batch
+    and the candidate k values are evaluated in parallel within an optional time budget.
+
     Parameters:
     data (DataFrame): The dataset to be clustered.
     default_flag (str): The name of the default flag variable in the dataset.
     cluster_number (int or str): The number of clusters to generate. If "optimal" is selected, the optimal number
                                   of clusters is determined automatically using the gap statistic method (default is "optimal").
+                                  The smallest k whose gap is within one standard error of the gap of k + 1
+                                  is selected.
+    sample_size (int): The number of rows in the subsample which represents each variable in the gap statistic
+                       (default is 10000).
+    sketch (str): "subsample" for a random row subsample or "projection" for a Gaussian random projection of all
+                  rows, computed in row chunks whose random matrix holds at most about four million values
+                  (default is "subsample").
+    projection_size (int): The dimension of the random projection (default is 256).
+    n_references (int): The number of uniform reference datasets per k (default is 10).
+    time_limit (float): Time budget in seconds for the gap statistic. The k values evaluated when it runs out are
+                        used (default is None, no limit).
+    seed (int): Random seed of the sketch and the reference datasets (default is None).
+    n_jobs (int): The number of workers for the candidate k values. None or -1 uses all CPU cores (default is 1).
+    backend (str): "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
 
     Returns:
     DataFrame: A DataFrame containing the variable clusters.
@@ -30,15 +49,31 @@ def variable_clustering(data, default_flag, cluster_number="optimal"):
     """
 
     def optimal_cluster(data):
-        opt_k = OptimalK(parallel_backend='multiprocessing')
-        n_clusters = opt_k(data.values, cluster_array=np.arange(1, data.shape[1]))
-        return n_clusters.optimal_k
+        size = sample_size if sketch == "subsample" else projection_size
+        points = _variable_sketch(data.to_numpy(dtype=float), size, sketch, seed)
+        cluster_array = np.arange(1, data.shape[1])
+        seeds = np.random.SeedSequence(seed).spawn(len(cluster_array))
+        tasks = [(points, k, n_references, k_seed) for k, k_seed in zip(cluster_array, seeds)]
+        gaps = parallel_map(_gap_value, tasks, n_jobs=n_jobs, backend=backend, timeout=time_limit)
+        evaluated = [(k, gap, error) for k, (gap, error) in
+                     ((k, result) for k, result in zip(cluster_array, gaps) if result is not None)
+                     if np.isfinite(gap)]
+        if not evaluated:
+            raise RuntimeError("The time limit ran out before any number of clusters was evaluated.")
+        # The smallest k whose gap is within one standard error of the gap of k + 1 (Tibshirani et al.)
+        for (k, gap, _), (next_k, next_gap, next_error) in zip(evaluated, evaluated[1:]):
+            if next_k == k + 1 and gap >= next_gap - next_error:
+                return k
+        return max(evaluated, key=lambda result: result[1])[0]
 
     def given_cluster(data, cluster_number):
         kmeans = KMeans(n_clusters=cluster_number, init='k-means++', max_iter=1000, n_init=1000)
         kmeans.fit(data.values.T)
         return kmeans.labels_
 
+    if sketch not in ("subsample", "projection"):
+        raise ValueError(f"Unknown sketch '{sketch}'. Use 'subsample' or 'projection'.")
+
     # Remove default_flag column from data
     data1 = data.drop(columns=[default_flag])
 
@@ -52,3 +87,43 @@ def variable_clustering(data, default_flag, cluster_number="optimal"):
     return variable_clusters
 
 
+def _variable_sketch(values, sample_size, sketch, seed, max_chunk_values=2 ** 22):
+    # One point per variable: its values on a row subsample, or a random projection of all its values
+    # of dimension sample_size
+    rng = np.random.default_rng(seed)
+    n = len(values)
+    if sketch == "subsample":
+        if n <= sample_size:
+            return values.T.copy()
+        rows = np.sort(rng.choice(n, size=sample_size, replace=False))
+        return values[rows].T.copy()
+
+    # Gaussian projection scaled to preserve the distances between variables, generated chunk by chunk with
+    # chunk_rows * sample_size bounded, so the memory does not depend on the number of rows
+    chunksize = max(1, max_chunk_values // sample_size)
+    points = np.zeros((values.shape[1], sample_size))
+    for start in range(0, n, chunksize):
+        chunk = values[start:start + chunksize]
+        projection = rng.standard_normal((len(chunk), sample_size)) / np.sqrt(sample_size)
+        points += chunk.T @ projection
+    return points
+
+
+def _gap_value(points, k, n_references, seed):
+    # Gap statistic of k clusters, mean log dispersion of uniform references minus that of the points,
+    # and its standard error
+    rng = np.random.default_rng(seed)
+    lower = points.min(axis=0)
+    upper = points.max(axis=0)
+    references = rng.uniform(lower, upper, size=(n_references,) + points.shape)
+
+    reference_log_dispersion = np.log([_dispersion(reference, k) for reference in references])
+    gap = np.mean(reference_log_dispersion) - np.log(_dispersion(points, k))
+    return gap, np.std(reference_log_dispersion) * np.sqrt(1 + 1 / n_references)
+
+
+def _dispersion(points, k):
+    # Within-cluster sum of squares of KMeans with k clusters
+    if k == 1:
+        return ((points - points.mean(axis=0)) ** 2).sum()
+    return KMeans(n_clusters=k, init='k-means++', n_init=10, random_state=0).fit(points).inertia_
@@ -1,9 +1,16 @@
 import pandas as pd
+import numpy as np
+from scipy.cluster.hierarchy import linkage, fcluster
+from scipy.spatial.distance import squareform
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
 from sklearn.cluster import KMeans
+from creditpy.parallel_backend import column_block_apply
+from creditpy.rank_auc import _binary_target, _rank_gini_matrix
+from creditpy.correlation_matrix import correlation_matrix
 
-def variable_clustering_gini(data, default_flag, cluster_number="optimal"):
+def variable_clustering_gini(data, default_flag, cluster_number="optimal", gini_method="logit", n_jobs=1, backend=None,
+                             method="kmeans", chunksize=100000, return_linkage=False):
     """
     Perform variable clustering and calculate Gini values for a given dataset.
 
@@ -11,14 +18,32 @@ def variable_clustering_gini(data, default_flag, cluster_number="optimal"):
     for each variable using logistic regression. The number of clusters can be determined optimally using the elbow method
     or manually.
 
+    With method="hierarchical" the variables are clustered VARCLUS-style on their correlations instead of with
+    KMeans on the raw data: the correlation matrix is computed once, chunked over rows, and the variables are
+    clustered by average linkage on the distance 1 - |correlation|. Any number of clusters and the elbow are read
+    off the one dendrogram without refitting.
+
     Parameters:
     data (DataFrame): The dataset to be clustered and for which Gini values are calculated.
     default_flag (str): The name of the default flag variable in the dataset.
     cluster_number (int or str): The number of clusters to generate. If "optimal" is selected, the optimal number
                                   of clusters is determined using the elbow method (default is "optimal").
+                                  For the hierarchical method the elbow is the largest gap between successive
+                                  merge heights of the dendrogram.
+    gini_method (str): "logit" fits a logistic regression for each variable. "rank" computes the same Gini from
+                       the ranks of the raw values without fitting a model (default is "logit").
+    n_jobs (int): The number of workers for the univariate Gini values. None or -1 uses all CPU cores (default is 1).
+    backend (str): "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+    method (str): "kmeans" or "hierarchical" (default is "kmeans").
+    chunksize (int): The number of rows per chunk of the correlation matrix of the hierarchical method
+                     (default is 100000).
+    return_linkage (bool): Also return the linkage matrix and the correlation matrix of the hierarchical method,
+                           from which other cuts of the dendrogram can be taken with scipy's fcluster
+                           (default is False).
 
     Returns:
-    DataFrame: A DataFrame containing the variables with their corresponding Gini values.
+    DataFrame: A DataFrame containing the variables with their corresponding Gini values. With return_linkage=True,
+               a dictionary with the DataFrame as 'clusters', the 'linkage' matrix and the 'correlation' matrix.
 
     Example:
     >>> import pandas as pd
@@ -29,16 +54,10 @@ def variable_clustering_gini(data, default_flag, cluster_number="optimal"):
     """
 
     def univariate_gini(data, default_flag):
-        gini_values = {}
-        for col in data.columns:
-            if col != default_flag:
-                X = data[col].values.reshape(-1, 1)
-                y = data[default_flag]
-                model = LogisticRegression()
-                model.fit(X, y)
-                y_pred = model.predict_proba(X)[:, 1]
-                auc_score = roc_auc_score(y, y_pred)
-                gini_values[col] = 2 * auc_score - 1
+        columns = [col for col in data.columns if col != default_flag]
+        ginis = column_block_apply(_univariate_gini_block, [data], columns, args=(default_flag, gini_method),
+                                   shared_columns=[default_flag], n_jobs=n_jobs, backend=backend)
+        gini_values = dict(zip(columns, ginis))
         return pd.DataFrame(list(gini_values.items()), columns=['Variable', 'Gini']).sort_values(by='Gini', ascending=False)
 
     def optimal_cluster(data):
@@ -58,10 +77,38 @@ def variable_clustering_gini(data, default_flag, cluster_number="optimal"):
         kmeans.fit(data.values.T)
         return kmeans.labels_
 
+    def hierarchical_cluster(data, cluster_number):
+        correlation = correlation_matrix(data, columns=list(data.columns), chunksize=chunksize)
+        distance = 1 - np.abs(np.nan_to_num(correlation.to_numpy(), nan=0.0))
+        np.fill_diagonal(distance, 0)
+        distance = np.clip((distance + distance.T) / 2, 0, None)
+        linkage_matrix = linkage(squareform(distance, checks=False), method='average')
+        if cluster_number == "optimal":
+            # Cutting after merge i leaves p - i - 1 clusters; keep between 1 and p - 1 clusters as above
+            heights = linkage_matrix[:, 2]
+            gaps = np.diff(heights)
+            cluster_number = data.shape[1] - (int(np.argmax(gaps)) + 1) if len(gaps) else 1
+        labels = fcluster(linkage_matrix, t=cluster_number, criterion='maxclust') - 1
+        return labels, linkage_matrix, correlation
+
+    if gini_method not in ("logit", "rank"):
+        raise ValueError(f"Unknown gini_method '{gini_method}'. Use 'logit' or 'rank'.")
+    if method not in ("kmeans", "hierarchical"):
+        raise ValueError(f"Unknown method '{method}'. Use 'kmeans' or 'hierarchical'.")
+
     # Calculate univariate Gini values
     gini_df = univariate_gini(data, default_flag)
 
     # Cluster variables
+    if method == "hierarchical":
+        clusters, linkage_matrix, correlation = hierarchical_cluster(data.drop(columns=[default_flag]),
+                                                                     cluster_number)
+        variable_clusters = pd.DataFrame({'Group': clusters, 'Variable': data.drop(columns=[default_flag]).columns})
+        merged_data = pd.merge(variable_clusters, gini_df, on='Variable')
+        if return_linkage:
+            return {'clusters': merged_data, 'linkage': linkage_matrix, 'correlation': correlation}
+        return merged_data
+
     if cluster_number == "optimal":
         cluster_number = optimal_cluster(data.drop(columns=[default_flag]))
     clusters = given_cluster(data.drop(columns=[default_flag]), cluster_number)
@@ -70,3 +117,21 @@ def variable_clustering_gini(data, default_flag, cluster_number="optimal"):
     # Merge variable clusters with Gini values
     merged_data = pd.merge(variable_clusters, gini_df, on='Variable')
     return merged_data
+
+
+def _univariate_gini_block(frames, columns, default_flag, gini_method):
+    # Univariate Gini values of a block of columns
+    data = frames[0]
+    if gini_method == "rank":
+        return list(_rank_gini_matrix(data[columns].to_numpy(dtype=float), _binary_target(data[default_flag])))
+
+    gini_values = []
+    for col in columns:
+        X = data[col].values.reshape(-1, 1)
+        y = data[default_flag]
+        model = LogisticRegression()
+        model.fit(X, y)
+        y_pred = model.predict_proba(X)[:, 1]
+        auc_score = roc_auc_score(y, y_pred)
+        gini_values.append(2 * auc_score - 1)
+    return gini_values
@@ -1,25 +1,112 @@
 import pandas as pd
 import numpy as np
-from statsmodels.stats.outliers_influence import variance_inflation_factor
+from creditpy.parallel_backend import column_block_apply
 
-def vif_calc(X):
+def vif_calc(X, n_jobs=1, backend=None, chunksize=100000):
     """
     Calculate Variance Inflation Factor (VIF) for a set of predictor variables.
 
     VIF measures the multicollinearity among predictor variables in a regression model.
     High VIF values indicate high multicollinearity.
 
+    The VIFs are those of statsmodels' variance_inflation_factor (version 0.14): every variable is regressed on
+    the raw other variables without an added constant, and the R-squared is centred only when the other
+    variables contain a constant, explicitly or as a linear combination. They are computed in closed form from
+    the cross-product X'X, accumulated once over row chunks, and the diagonal of its inverse. If X'X is singular,
+    the separate regressions are fitted instead, with the same definition.
+
     Parameters:
     X : pandas DataFrame
         The design matrix containing the predictor variables.
+    n_jobs : int, optional
+        The number of workers of the separate regressions. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+    chunksize : int, optional
+        The number of rows per chunk of the cross-product. Default is 100000.
 
     Returns:
     pandas DataFrame:
         VIF values for each predictor variable.
     """
+    gram, sums, n = _cross_products(X, chunksize)
+    inverse = _gram_inverse(gram)
+    if inverse is not None:
+        return pd.Series(_vif_values(inverse, np.diag(gram), sums, n), index=pd.Index(X.columns, name="Variable"),
+                         name="VIF")
+
+    # Every VIF regresses one variable on all the others, so each block needs the whole design matrix
     vif_data = pd.DataFrame()
     vif_data["Variable"] = X.columns
-    vif_data["VIF"] = [variance_inflation_factor(X.values, i) for i in range(X.shape[1])]
+    vif_data["VIF"] = column_block_apply(_vif_block, [X], list(X.columns), shared_columns=list(X.columns),
+                                         n_jobs=n_jobs, backend=backend)
     return vif_data.set_index("Variable")["VIF"]
 
 
+def _vif_block(frames, columns):
+    # VIF values of a block of columns, each regressed by least squares on every other column of the frame
+    values = frames[0].to_numpy(dtype=float)
+    vif_values = []
+    for column in columns:
+        j = frames[0].columns.get_loc(column)
+        y = values[:, j]
+        others = np.delete(values, j, axis=1)
+        coefficients = np.linalg.lstsq(others, y, rcond=None)[0]
+        residual = y - others @ coefficients
+        if _has_constant(others):
+            y = y - y.mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vif_values.append(np.dot(y, y) / np.dot(residual, residual))
+    return vif_values
+
+
+def _has_constant(values):
+    # An explicit constant column, or a constant in the span of the columns, as statsmodels' k_constant
+    if values.shape[1] == 0:
+        return False
+    if np.any((np.ptp(values, axis=0) == 0) & np.any(values != 0, axis=0)):
+        return True
+    augmented = np.column_stack([np.ones(len(values)), values])
+    return np.linalg.matrix_rank(augmented) == np.linalg.matrix_rank(values)
+
+
+def _cross_products(X, chunksize):
+    # X'X and the column sums, accumulated over row chunks in float64
+    p = X.shape[1]
+    gram = np.zeros((p, p))
+    sums = np.zeros(p)
+    for start in range(0, len(X), chunksize):
+        values = X.iloc[start:start + chunksize].to_numpy(dtype=float)
+        gram += values.T @ values
+        sums += values.sum(axis=0)
+    return gram, sums, len(X)
+
+
+def _gram_inverse(gram):
+    # Inverse of X'X, computed on the unit-diagonal scaling of the matrix; None if it is singular
+    diagonal = np.diag(gram)
+    if not np.all(np.isfinite(gram)) or np.any(diagonal <= 0):
+        return None
+    scale = 1 / np.sqrt(diagonal)
+    scaled = gram * np.outer(scale, scale)
+    if len(scaled) and np.linalg.cond(scaled) > 1e12:
+        return None
+    return np.linalg.inv(scaled) * np.outer(scale, scale)
+
+
+def _vif_values(inverse, squares, sums, n):
+    # VIF of every column from the inverse of X'X: the residual sum of squares of column i on the others is
+    # 1 / inverse[i, i], and the total sum of squares is centred when the others contain a constant
+    diagonal = np.diag(inverse)
+    vif = squares * diagonal
+    if len(diagonal) < 2:
+        return vif
+
+    # Residual sum of squares of a column of ones on the other columns, n - s' inv(X_-i'X_-i) s, with the
+    # inverse of the others obtained from the full inverse by removing row and column i
+    t = inverse @ sums
+    explained = (sums @ t - 2 * sums * t + sums ** 2 * diagonal) - (t - diagonal * sums) ** 2 / diagonal
+    implicit_constant = n - explained <= 1e-9 * n
+    centred = implicit_constant & (squares - sums ** 2 / n > 0)
+    vif[centred] = (squares - sums ** 2 / n)[centred] * diagonal[centred]
+    return vif
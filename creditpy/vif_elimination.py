@@ -0,0 +1,67 @@
+import pandas as pd
+import numpy as np
+from creditpy.vif_calc import _cross_products, _gram_inverse, _vif_values
+
+
+def vif_elimination(X, threshold=5, chunksize=100000, verbose=True):
+    """
+    Remove the variable with the highest VIF, one at a time, until all VIFs are below the threshold.
+
+    The cross-product X'X is accumulated once over row chunks and inverted once, and the VIFs are those of
+    vif_calc. When a variable is removed, the inverse for the remaining variables is obtained with a rank-one
+    downdate of the current inverse instead of being recomputed, so every step costs O(p^2).
+
+    Parameters:
+    X : pandas DataFrame
+        The design matrix containing the predictor variables.
+    threshold : float, optional
+        Variables are removed while the highest VIF is above this value. Default is 5.
+    chunksize : int, optional
+        The number of rows per chunk of the cross-product. Default is 100000.
+    verbose : bool, optional
+        Print every removed variable. Default is True.
+
+    Returns:
+    dict
+        A dictionary containing:
+        - 'vif': The VIF of every remaining variable.
+        - 'elimination_path': The removed variable, its VIF and the number of remaining variables per step.
+        - 'remaining_variables': The remaining variables.
+
+    Examples:
+    >>> result = vif_elimination(train_woe.drop(columns=['creditability']), threshold=5)
+    >>> result['elimination_path']
+    """
+    gram, sums, n = _cross_products(X, chunksize)
+    inverse = _gram_inverse(gram)
+    if inverse is None:
+        raise ValueError("The cross-product matrix is singular; remove the perfectly collinear variables first, "
+                         "for example with vif_calc.")
+
+    squares = np.diag(gram)
+    columns = np.arange(X.shape[1])
+    path = []
+    while len(columns) > 1:
+        vif = _vif_values(inverse, squares[columns], sums[columns], n)
+        worst = int(np.argmax(vif))
+        if vif[worst] <= threshold:
+            break
+
+        removed = X.columns[columns[worst]]
+        if verbose:
+            print(f"Removed: {removed}, VIF: {vif[worst]}")
+        path.append([len(path) + 1, removed, vif[worst], len(columns) - 1])
+
+        # Inverse without row and column k: A - a a' / a_kk, with a the k-th column of the inverse
+        keep = np.arange(len(columns)) != worst
+        column = inverse[keep, worst]
+        inverse = inverse[np.ix_(keep, keep)] - np.outer(column, column) / inverse[worst, worst]
+        columns = columns[keep]
+
+    vif = _vif_values(inverse, squares[columns], sums[columns], n)
+    remaining = list(X.columns[columns])
+    return {
+        'vif': pd.Series(vif, index=pd.Index(remaining, name="Variable"), name="VIF"),
+        'elimination_path': pd.DataFrame(path, columns=['Step', 'Variable', 'VIF', 'Remaining.Count']),
+        'remaining_variables': remaining
+    }
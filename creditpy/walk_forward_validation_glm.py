@@ -0,0 +1,162 @@
+import time as timer
+import pandas as pd
+import numpy as np
+from scipy.stats import norm
+from sklearn.linear_model import LogisticRegression
+from creditpy.rank_auc import _binary_target, _sorted_auc
+from creditpy.parallel_backend import parallel_map, _resolve_backend
+
+
+def walk_forward_validation_glm(model_data, default_flag, time, window="expanding", train_periods=1,
+                                warm_start=False, n_jobs=1, backend=None):
+    """
+    Walk-forward out-of-time validation of a logistic regression.
+
+    For every period after the first train_periods periods, the model is trained on the preceding periods and
+    tested on that period. The design matrix, normally the WOE variables, is extracted once and sorted by
+    time, so every training window is a contiguous slice of it; the test scores are sorted once for both
+    the Gini and the KS. The windows are fitted in parallel.
+
+    Parameters:
+    model_data : pandas DataFrame
+        The dataset. All numeric columns other than the default flag and the time variable are predictors.
+    default_flag : str
+        The column name of the default flag.
+    time : str
+        The column name of the time variable, for example the vintage or snapshot month.
+    window : str, optional
+        "expanding" trains on all periods before the test period, "sliding" on the train_periods periods
+        before it. Default is "expanding".
+    train_periods : int, optional
+        The number of periods of the first (expanding) or of every (sliding) training window. Default is 1.
+    warm_start : bool, optional
+        Initialize every fit from the coefficients of the model of the first training window, which is fitted
+        once before the windows are distributed, so the results do not depend on n_jobs. Default is False.
+    n_jobs : int, optional
+        The number of workers. None or -1 uses all CPU cores. Default is 1.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "serial" for a single worker and "processes" otherwise.
+
+    Returns:
+    pandas DataFrame
+        For every test period: the training window, the number of observations, the train and test Gini,
+        the test KS (%), the mean PD against the default rate with the binomial z-statistic and p-value,
+        and the fit time in seconds. The last row holds the averages, with the binomial test pooled over all
+        test periods.
+
+    Examples:
+    walk_forward_validation_glm(woe_data, "creditability", "vintage", window="sliding", train_periods=12,
+                                n_jobs=4)
+    """
+    if window not in ("expanding", "sliding"):
+        raise ValueError(f"Unknown window '{window}'. Use 'expanding' or 'sliding'.")
+
+    # Sort by time once; every period is then a contiguous block of rows
+    codes, periods = pd.factorize(model_data[time], sort=True)
+    known_time = np.flatnonzero(codes >= 0)
+    order = known_time[np.argsort(codes[known_time], kind='stable')]
+    bounds = np.r_[0, np.cumsum(np.bincount(codes[known_time], minlength=len(periods)))]
+
+    predictor_columns = [column for column in model_data.select_dtypes(include=[np.number]).columns
+                         if column not in (default_flag, time)]
+    X = np.ascontiguousarray(model_data[predictor_columns].to_numpy(dtype=float)[order])
+    y = _binary_target(model_data[default_flag])[order]
+
+    windows = []
+    for test in range(train_periods, len(periods)):
+        first = 0 if window == "expanding" else test - train_periods
+        windows.append((bounds[first], bounds[test], bounds[test + 1]))
+    if not windows:
+        raise ValueError(f"At least {train_periods + 1} periods are needed, found {len(periods)}.")
+
+    # Every warm start begins from the same fit of the first training window, whatever the worker split
+    init = _fit_window(X, y, *windows[0][:2], None)[0] if warm_start else None
+
+    # One block of consecutive windows per worker, so every worker receives the design matrix once
+    _, workers = _resolve_backend(n_jobs, backend, len(windows))
+    blocks = np.array_split(np.arange(len(windows)), workers)
+    tasks = [(X, y, [windows[i] for i in block], init) for block in blocks]
+    results = [result for block_results in parallel_map(_fit_windows, tasks, n_jobs=workers, backend=backend)
+               for result in block_results]
+
+    test_positions = range(train_periods, len(periods))
+    result = pd.DataFrame(results, columns=['Train.Count', 'Test.Count', 'GiniTrain', 'GiniTest', 'KS', 'Mean.PD',
+                                           'Default.Rate', 'FitTime'])
+    result.insert(0, 'Test.Period', [periods[test] for test in test_positions])
+    result.insert(1, 'Train.Start', [periods[0 if window == "expanding" else test - train_periods]
+                                     for test in test_positions])
+    result.insert(2, 'Train.End', [periods[test - 1] for test in test_positions])
+
+    # Binomial test of the mean PD against the observed default rate
+    expected = result['Mean.PD'] * result['Test.Count']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (result['Default.Rate'] * result['Test.Count'] - expected) / np.sqrt(expected * (1 - result['Mean.PD']))
+    fit_time = result.pop('FitTime')
+    result['Binomial.Z'] = z
+    result['Binomial.P.Value'] = 2 * norm.sf(np.abs(z))
+    result['FitTime'] = fit_time
+
+    # Averages, with the counts rounded and the binomial test pooled over the test periods
+    average = result.drop(columns=['Test.Period', 'Train.Start', 'Train.End']).mean()
+    average[['Train.Count', 'Test.Count']] = average[['Train.Count', 'Test.Count']].round()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled_z = (result['Default.Rate'] * result['Test.Count'] - expected).sum() / \
+            np.sqrt((expected * (1 - result['Mean.PD'])).sum())
+    average['Binomial.Z'] = pooled_z
+    average['Binomial.P.Value'] = 2 * norm.sf(np.abs(pooled_z))
+    average_row = pd.DataFrame([{'Test.Period': 'Average', **average.to_dict()}])
+    average_row = average_row.astype({'Train.Count': result['Train.Count'].dtype,
+                                      'Test.Count': result['Test.Count'].dtype})
+
+    return pd.concat([result, average_row], ignore_index=True)
+
+
+def _fit_window(X, y, start, end, init):
+    # Fit the model of a training window, from the coefficients of the init model if any, and return it with
+    # the mask of its rows with a known default flag and the fit time
+    known = ~np.isnan(y[start:end])
+    fit_start = timer.perf_counter()
+    model = LogisticRegression(warm_start=init is not None)
+    if init is not None:
+        model.coef_, model.intercept_ = init.coef_.copy(), init.intercept_.copy()
+    model.fit(X[start:end][known], y[start:end][known])
+    return model, known, timer.perf_counter() - fit_start
+
+
+def _fit_windows(X, y, windows, init=None):
+    # Fit and test the model of every window of a block
+    results = []
+    for start, end, test_end in windows:
+        train = slice(start, end)
+        model, known, fit_time = _fit_window(X, y, start, end, init)
+
+        train_scores = model.predict_proba(X[train][known])[:, 1]
+        train_order = np.argsort(train_scores, kind='mergesort')
+        gini_train = 2 * _sorted_auc(train_scores[train_order], y[train][known][train_order]) - 1
+
+        test_y = y[end:test_end]
+        test_known = ~np.isnan(test_y)
+        test_scores = model.predict_proba(X[end:test_end][test_known])[:, 1]
+        test_y = test_y[test_known]
+
+        # Gini and KS from one sort of the test scores
+        test_order = np.argsort(test_scores, kind='mergesort')
+        sorted_scores = test_scores[test_order]
+        sorted_y = test_y[test_order]
+        gini_test = 2 * _sorted_auc(sorted_scores, sorted_y) - 1
+        ks = _sorted_ks(sorted_scores, sorted_y)
+
+        results.append((known.sum(), test_known.sum(), gini_train, gini_test, ks * 100, test_scores.mean(),
+                        test_y.mean(), fit_time))
+    return results
+
+
+def _sorted_ks(sorted_scores, sorted_target):
+    # Kolmogorov-Smirnov statistic of scores which are already sorted ascending
+    n_bad = sorted_target.sum()
+    n_good = len(sorted_target) - n_bad
+    if n_bad == 0 or n_good == 0:
+        return np.nan
+    last = np.r_[sorted_scores[1:] != sorted_scores[:-1], True]
+    distance = np.cumsum(sorted_target)[last] / n_bad - np.cumsum(1 - sorted_target)[last] / n_good
+    return np.abs(distance).max()
@@ -1,10 +1,16 @@
 import pandas as pd
 import numpy as np
+from creditpy.woe_transformer import WoeTransformer
+from creditpy.stats_cache import _cached_column_apply
 
-def woe_binning(df_train, df_test, target_column, bins=10):
+def woe_binning(df_train, df_test, target_column, bins=10, cache=None):
     """
     Apply WOE transformation to the specified training and test dataframes.
 
+    The bins are fitted with a WoeTransformer: quantile edges for all numeric variables come from one 2-D
+    quantile computation, bins are assigned as int8/int16 codes and events are counted with bincount.
+    The input dataframes are not modified and the WOE values are returned as float32.
+
     Parameters:
         df_train : DataFrame
             The training dataframe containing the predictor variables.
@@ -14,6 +20,9 @@ def woe_binning(df_train, df_test, target_column, bins=10):
             The name of the target column in the dataframes.
         bins : int, optional (default=10)
             The number of bins to use for binning the predictor variables.
+        cache : StatsCache, optional (default=None)
+            Cache of the bins and event counts of every variable. Variables whose training values and
+            target are unchanged are not binned again.
 
     Returns:
         train_woe : DataFrame
@@ -21,50 +30,37 @@ def woe_binning(df_train, df_test, target_column, bins=10):
         test_woe : DataFrame
             The test dataframe with WOE-transformed variables.
     """
-    def calculate_woe(df, column, target_column):
-        grouped = df.groupby(column)[target_column].agg(['count', 'sum'])
-        grouped['non_events'] = grouped['count'] - grouped['sum']
-        grouped['events'] = grouped['sum']
-        grouped['event_rate'] = grouped['events'] / grouped['events'].sum()
-        grouped['non_event_rate'] = grouped['non_events'] / grouped['non_events'].sum()
-        grouped['woe'] = np.log(grouped['event_rate'] / grouped['non_event_rate'])
-        woe_values = grouped['woe'].to_dict()
-        return woe_values
-
-    def apply_woe(df, woerules):
-        for column, rule in woerules.items():
-            bin_column = column + '_bin'
-            if bin_column in df.columns:
-                df[bin_column] = df[bin_column].map(rule)
-                df.drop(column, axis=1, inplace=True)  # Drop the original column
-            else:
-                print(f"Binning column '{bin_column}' not found in the dataframe.")
-        return df
-
-    woerules = {}
-    for column in df_train.columns:
-        if column != target_column:
-            if not pd.api.types.is_numeric_dtype(df_train[column]):
-                try:
-                    df_train[column] = pd.to_numeric(df_train[column])
-                    df_test[column] = pd.to_numeric(df_test[column])
-                except ValueError:
-                    print(f"Column '{column}' could not be converted to numeric type.")
-                    continue
-            binned_column, bins_info = pd.qcut(df_train[column], bins, retbins=True, duplicates='drop')
-            df_train[column + '_bin'] = binned_column
-            df_test[column + '_bin'] = pd.cut(df_test[column], bins=bins_info, labels=bins_info[:-1], include_lowest=True)
-            woerules[column] = calculate_woe(df_train, column + '_bin', target_column)
+    # Missing values and test values outside the training bins get no WOE, as with pd.cut
+    if cache is None:
+        transformer = WoeTransformer(bins=bins, missing_woe=np.nan, unseen_woe=np.nan)
+        train_bins = transformer.fit_transform(df_train, target_column)
+    else:
+        variables = [column for column in df_train.columns if column != target_column]
+        fitted = _cached_column_apply(cache, "woe", _woe_block, [df_train], variables, args=(target_column, bins),
+                                      shared_columns=[target_column], params=bins)
+        fitted = {variable: result for variable, result in zip(variables, fitted) if result is not None}
+        transformer = WoeTransformer.from_counts(
+            target_column, *({variable: result[i] for variable, result in fitted.items()} for i in range(3)),
+            bins=bins, missing_woe=np.nan, unseen_woe=np.nan)
+        train_bins = transformer.transform(df_train)
+    test_bins = transformer.transform(df_test)
 
-    train_woe = apply_woe(df_train, woerules)
-    test_woe = apply_woe(df_test, woerules)
+    # Variables which could not be binned are kept as they are, followed by the WOE columns
+    train_kept = [column for column in df_train.columns if column not in transformer.columns_]
+    test_kept = [column for column in df_test.columns if column not in transformer.columns_]
+    train_woe = pd.concat([df_train[train_kept], train_bins], axis=1)
+    test_woe = pd.concat([df_test[test_kept], test_bins], axis=1)
 
-    # Convert all columns to numeric
-    train_woe = train_woe.apply(pd.to_numeric, errors='ignore')
-    test_woe = test_woe.apply(pd.to_numeric, errors='ignore')
+    return train_woe, test_woe
 
-    # Replace infinite values with 0
-    train_woe.replace([np.inf, -np.inf], 0, inplace=True)
-    test_woe.replace([np.inf, -np.inf], 0, inplace=True)
 
-    return train_woe, test_woe
+def _woe_block(frames, columns, target_column, bins):
+    # Bin edges, events and non-events of a block of columns; None for variables which cannot be binned
+    transformer = WoeTransformer(bins=bins).fit(frames[0][columns + [target_column]], target_column)
+    table = transformer.bin_table_
+    fitted = {}
+    for j, column in enumerate(transformer.columns_):
+        rows = table['Variable'] == column
+        fitted[column] = (transformer.edges_[transformer.edge_offsets_[j]:transformer.edge_offsets_[j + 1]],
+                          table.loc[rows, 'Events'].to_numpy(), table.loc[rows, 'Non.Events'].to_numpy())
+    return [fitted.get(column) for column in columns]
@@ -0,0 +1,142 @@
+import pandas as pd
+import numpy as np
+from creditpy.quantile_sketch import QuantileSketch
+
+
+def woe_binning_chunked(source, target_column, bins=10, chunksize=100000, sketch_size=200, file_format=None,
+                        seed=None):
+    """
+    Fit WOE binning rules from data which is read in chunks.
+
+    The first pass builds a mergeable quantile sketch for every numeric column and takes the bin edges from
+    it, as pd.qcut does on the full data. The second pass counts the events and non-events of every bin.
+    Memory is bounded by the number of columns times the sketch size and the number of bins, not by the
+    number of rows. The bin edges match those of woe_binning within the rank error of the sketch.
+
+    Parameters:
+        source : str, callable, DataFrame or list of DataFrame
+            A path to a CSV or Parquet file, a function which returns a new iterator of DataFrame chunks on
+            every call, a list of DataFrame chunks or a DataFrame. The data is read twice, so a one-shot
+            iterator is not accepted.
+        target_column : str
+            The name of the target column. Events are rows where the target equals 1.
+        bins : int, optional (default=10)
+            The number of bins to use for binning the predictor variables.
+        chunksize : int, optional (default=100000)
+            The number of rows per chunk when reading a file or splitting a DataFrame.
+        sketch_size : int, optional (default=200)
+            The capacity of the quantile sketches. Larger values give more accurate bin edges.
+        file_format : str, optional
+            "csv" or "parquet". By default it is inferred from the file extension.
+        seed : int, optional
+            Seed of the quantile sketches.
+
+    Returns:
+        dict
+            A dictionary containing:
+            - 'woe_rules': WOE value of every bin interval, per variable.
+            - 'edges': Bin edges per variable. The first bin includes its left edge.
+            - 'bin_table': DataFrame with the events, non-events and WOE of every bin.
+            - 'rank_error': Guaranteed rank error bound of the bin edges per variable.
+    """
+    def read_chunks():
+        return _iter_chunks(source, chunksize, file_format)
+
+    # First pass: quantile sketches of the numeric columns
+    sketches = {}
+    for chunk in read_chunks():
+        if not sketches:
+            for column in chunk.columns:
+                if column == target_column:
+                    continue
+                if not pd.api.types.is_numeric_dtype(chunk[column]):
+                    try:
+                        pd.to_numeric(chunk[column])
+                    except ValueError:
+                        print(f"Column '{column}' could not be converted to numeric type.")
+                        continue
+                sketches[column] = QuantileSketch(k=sketch_size, seed=seed)
+        for column, sketch in sketches.items():
+            sketch.update(pd.to_numeric(chunk[column], errors='coerce'))
+
+    quantiles = np.linspace(0, 1, bins + 1)
+    edges = {column: np.unique(sketch.quantile(quantiles)) for column, sketch in sketches.items()}
+
+    # Second pass: events and non-events per bin
+    events = {column: np.zeros(max(len(edge) - 1, 1)) for column, edge in edges.items()}
+    non_events = {column: np.zeros(max(len(edge) - 1, 1)) for column, edge in edges.items()}
+    for chunk in read_chunks():
+        target = pd.to_numeric(chunk[target_column], errors='coerce').to_numpy(dtype=float)
+        for column, edge in edges.items():
+            codes = _bin_codes(pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=float), edge)
+            valid = (codes >= 0) & ~np.isnan(target)
+            n_bins = len(events[column])
+            events[column] += np.bincount(codes[valid], weights=target[valid], minlength=n_bins)
+            non_events[column] += np.bincount(codes[valid], weights=1 - target[valid], minlength=n_bins)
+
+    woe_rules = {}
+    bin_tables = []
+    for column, edge in edges.items():
+        woe = _woe_values(events[column], non_events[column])
+        intervals = pd.IntervalIndex.from_breaks(edge, closed='right') if len(edge) > 1 else \
+            pd.IntervalIndex.from_tuples([(edge[0], edge[0])], closed='both')
+        woe_rules[column] = dict(zip(intervals, woe))
+        bin_tables.append(pd.DataFrame({
+            'Variable': column,
+            'Bin': intervals,
+            'Events': events[column],
+            'Non.Events': non_events[column],
+            'WOE': woe
+        }))
+
+    bin_table = pd.concat(bin_tables, ignore_index=True) if bin_tables else \
+        pd.DataFrame(columns=['Variable', 'Bin', 'Events', 'Non.Events', 'WOE'])
+
+    return {
+        'woe_rules': woe_rules,
+        'edges': edges,
+        'bin_table': bin_table,
+        'rank_error': pd.Series({column: sketch.rank_error() for column, sketch in sketches.items()},
+                                dtype=float)
+    }
+
+
+def _iter_chunks(source, chunksize, file_format=None):
+    # A new iterator of DataFrame chunks over the source
+    if isinstance(source, pd.DataFrame):
+        return (source.iloc[start:start + chunksize] for start in range(0, len(source), chunksize))
+    if isinstance(source, (list, tuple)):
+        return iter(source)
+    if callable(source):
+        return iter(source())
+    if isinstance(source, str):
+        if file_format is None:
+            file_format = "parquet" if source.lower().endswith((".parquet", ".pq")) else "csv"
+        if file_format == "parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Reading Parquet files in chunks requires the pyarrow package.")
+            parquet_file = pq.ParquetFile(source)
+            return (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize))
+        if file_format == "csv":
+            return pd.read_csv(source, chunksize=chunksize)
+        raise ValueError(f"Unknown file_format '{file_format}'. Use 'csv' or 'parquet'.")
+    raise ValueError("source must be a file path, a function returning an iterator of DataFrames, "
+                     "a list of DataFrames or a DataFrame. A one-shot iterator cannot be read twice.")
+
+
+def _bin_codes(values, edges):
+    # Right-closed bin index of every value as in pd.cut with include_lowest=True; -1 outside the edges or missing
+    codes = np.searchsorted(edges, values, side='left') - 1
+    codes[values == edges[0]] = 0
+    codes[(values < edges[0]) | (values > edges[-1]) | np.isnan(values)] = -1
+    return codes
+
+
+def _woe_values(events, non_events):
+    # WOE of every bin; infinite values are replaced with 0 as in woe_binning
+    with np.errstate(divide='ignore', invalid='ignore'):
+        woe = np.log((events / events.sum()) / (non_events / non_events.sum()))
+    woe[np.isinf(woe)] = 0
+    return woe
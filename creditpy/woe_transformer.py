@@ -0,0 +1,251 @@
+import pandas as pd
+import numpy as np
+from creditpy.woe_binning_chunked import woe_binning_chunked, _bin_codes, _woe_values
+
+
+class WoeTransformer:
+    """
+    Fitted, reusable WOE transformation.
+
+    The bin edges and WOE values of all variables are kept in contiguous NumPy arrays. transform looks up
+    the bin of every value with searchsorted and maps it to its WOE with fancy indexing into a preallocated
+    float32 matrix, so new data can be scored without refitting.
+
+    Bins are right-closed and the first bin includes its left edge, as with pd.qcut in woe_binning.
+
+    Parameters:
+        bins : int, optional (default=10)
+            The number of quantile bins to use for binning the predictor variables.
+        missing_woe : float, optional (default=0.0)
+            WOE value given to missing values.
+        unseen_woe : float, optional (default=0.0)
+            WOE value given to values outside the range of the fitted bins.
+        dtype : numpy dtype, optional (default=np.float32)
+            The data type of the transformed values.
+
+    Examples:
+    >>> transformer = WoeTransformer(bins=10).fit(train, "creditability")
+    >>> test_woe = transformer.transform(test)
+    >>> transformer.bin_table_
+    """
+
+    def __init__(self, bins=10, missing_woe=0.0, unseen_woe=0.0, dtype=np.float32):
+        self.bins = bins
+        self.missing_woe = missing_woe
+        self.unseen_woe = unseen_woe
+        self.dtype = dtype
+
+    def fit(self, df, target_column):
+        """
+        Fit the bin edges and WOE values of every numeric variable. The input dataframe is not modified.
+
+        Parameters:
+            df : DataFrame
+                The training dataframe containing the predictor variables and the target.
+            target_column : str
+                The name of the target column. Events are rows where the target equals 1.
+
+        Returns:
+            WoeTransformer
+                The fitted transformer.
+        """
+        self._fit_codes(df, target_column)
+        return self
+
+    @classmethod
+    def from_counts(cls, target_column, edges, events, non_events, bins=10, missing_woe=0.0, unseen_woe=0.0,
+                    dtype=np.float32):
+        """
+        Build a fitted transformer from the bin edges and event counts of every variable, for example bins
+        fitted on another sample or read from a cache.
+
+        Parameters:
+            target_column : str
+                The name of the target column.
+            edges : dict
+                The sorted bin edges of every variable, in the order of the transformed columns.
+            events : dict
+                The number of events in every bin of every variable.
+            non_events : dict
+                The number of non-events in every bin of every variable.
+            bins, missing_woe, unseen_woe, dtype :
+                As in the constructor.
+
+        Returns:
+            WoeTransformer
+                The fitted transformer.
+        """
+        transformer = cls(bins=bins, missing_woe=missing_woe, unseen_woe=unseen_woe, dtype=dtype)
+        return transformer._set_bins(target_column, edges, events, non_events)
+
+    def fit_chunks(self, source, target_column, chunksize=100000, sketch_size=200, file_format=None, seed=None):
+        """
+        Fit the transformer from data which is read in chunks. See woe_binning_chunked for the parameters.
+
+        Returns:
+            WoeTransformer
+                The fitted transformer.
+        """
+        result = woe_binning_chunked(source, target_column, bins=self.bins, chunksize=chunksize,
+                                     sketch_size=sketch_size, file_format=file_format, seed=seed)
+        table = result['bin_table']
+        events = {column: table.loc[table['Variable'] == column, 'Events'].to_numpy()
+                  for column in result['edges']}
+        non_events = {column: table.loc[table['Variable'] == column, 'Non.Events'].to_numpy()
+                      for column in result['edges']}
+        fitted = self.from_counts(target_column, result['edges'], events, non_events, bins=self.bins,
+                                  missing_woe=self.missing_woe, unseen_woe=self.unseen_woe, dtype=self.dtype)
+        vars(self).update(vars(fitted))
+        return self
+
+    def transform(self, df, suffix='_bin'):
+        """
+        Replace every fitted variable with its WOE values.
+
+        Parameters:
+            df : DataFrame
+                The dataframe containing the fitted predictor variables.
+            suffix : str, optional (default='_bin')
+                Suffix added to the variable names, as in the output of woe_binning.
+
+        Returns:
+            DataFrame
+                The WOE values of the fitted variables, with the index of the input.
+        """
+        return pd.DataFrame(self.transform_array(df), index=df.index,
+                            columns=[column + suffix for column in self.columns_], copy=False)
+
+    def transform_array(self, df):
+        """
+        Return the WOE values of the fitted variables as an (observations x variables) array.
+        """
+        missing_columns = [column for column in self.columns_ if column not in df.columns]
+        if missing_columns:
+            raise KeyError(f"Columns {missing_columns} were fitted but are not in the dataframe.")
+
+        result = np.empty((len(df), len(self.columns_)), dtype=self.dtype, order='F')
+        for j, column in enumerate(self.columns_):
+            values = _numeric_values(df[column], errors='coerce')
+            np.take(self.lookup_[self.lookup_offsets_[j]:self.lookup_offsets_[j + 1]],
+                    self._lookup_index(values, j), out=result[:, j])
+        return result
+
+    def fit_transform(self, df, target_column, suffix='_bin'):
+        """Fit the transformer and transform the same dataframe, reusing the bin codes of the fit."""
+        codes = self._fit_codes(df, target_column)
+
+        result = np.empty(codes.shape, dtype=self.dtype, order='F')
+        for j in range(len(self.columns_)):
+            # Bin b is at position b + 1 of the lookup table; code -1 marks a missing value
+            index = codes[:, j].astype(np.intp) + 1
+            index[index == 0] = self.edge_offsets_[j + 1] - self.edge_offsets_[j] + 1
+            np.take(self.lookup_[self.lookup_offsets_[j]:self.lookup_offsets_[j + 1]], index, out=result[:, j])
+
+        return pd.DataFrame(result, index=df.index, columns=[column + suffix for column in self.columns_],
+                            copy=False)
+
+    def _fit_codes(self, df, target_column):
+        # Fit the bins of all numeric variables at once and return their int8/int16 bin codes (-1 if missing)
+        target = pd.to_numeric(df[target_column], errors='coerce').to_numpy(dtype=float)
+        columns, values = _numeric_matrix(df, target_column)
+
+        # Quantile edges of every variable from one 2-D quantile call
+        quantiles = np.linspace(0, 1, self.bins + 1)
+        with np.errstate(invalid='ignore'):
+            if np.isnan(values).any():
+                all_edges = np.nanquantile(values, quantiles, axis=0)
+            else:
+                all_edges = np.quantile(values, quantiles, axis=0)
+
+        code_dtype = np.int8 if self.bins < np.iinfo(np.int8).max else np.int16
+        codes = np.empty(values.shape, dtype=code_dtype, order='F')
+        edges = {}
+        events = {}
+        non_events = {}
+        known = ~np.isnan(target)
+        for j, column in enumerate(columns):
+            edge = np.unique(all_edges[:, j])
+            codes[:, j] = _bin_codes(values[:, j], edge)
+            valid = known & (codes[:, j] >= 0)
+            n_bins = max(len(edge) - 1, 1)
+            edges[column] = edge
+            events[column] = np.bincount(codes[valid, j], weights=target[valid], minlength=n_bins)
+            non_events[column] = np.bincount(codes[valid, j], weights=1 - target[valid], minlength=n_bins)
+
+        self._set_bins(target_column, edges, events, non_events)
+        return codes
+
+    def _lookup_index(self, values, j):
+        # Position in the lookup table: 0 below the first edge, 1..k for the bins, k + 1 above the last edge
+        # and k + 2 for missing values
+        edges = self.edges_[self.edge_offsets_[j]:self.edge_offsets_[j + 1]]
+        index = np.searchsorted(edges, values, side='left')
+        index[values == edges[0]] = 1
+        index[np.isnan(values)] = len(edges) + 1
+        return index
+
+    def _set_bins(self, target_column, edges, events, non_events):
+        # Store the bins of all variables in contiguous arrays
+        self.target_column = target_column
+        self.columns_ = list(edges)
+        # A constant variable has a single edge; doubling it gives one bin which holds only that value
+        edges = {column: np.r_[edge, edge] if len(edge) == 1 else edge for column, edge in edges.items()}
+
+        woe = {column: _woe_values(events[column], non_events[column]) for column in self.columns_}
+        self.edges_ = np.concatenate([edges[column] for column in self.columns_]) if self.columns_ \
+            else np.empty(0)
+        self.edge_offsets_ = np.cumsum([0] + [len(edges[column]) for column in self.columns_])
+        self.woe_ = np.concatenate([woe[column] for column in self.columns_]) if self.columns_ else np.empty(0)
+        self.woe_offsets_ = np.cumsum([0] + [len(woe[column]) for column in self.columns_])
+
+        # Lookup table per variable: [unseen below, bin WOEs..., unseen above, missing]
+        lookups = []
+        for column in self.columns_:
+            bin_woe = np.nan_to_num(woe[column], nan=self.unseen_woe)
+            lookups.append(np.r_[self.unseen_woe, bin_woe, self.unseen_woe, self.missing_woe])
+        self.lookup_ = np.concatenate(lookups).astype(self.dtype) if lookups else np.empty(0, dtype=self.dtype)
+        self.lookup_offsets_ = np.cumsum([0] + [len(lookup) for lookup in lookups])
+
+        tables = []
+        for column in self.columns_:
+            edge = edges[column]
+            intervals = pd.IntervalIndex.from_breaks(edge, closed='right') if edge[0] < edge[-1] else \
+                pd.IntervalIndex.from_tuples([(edge[0], edge[0])], closed='both')
+            tables.append(pd.DataFrame({
+                'Variable': column,
+                'Bin': intervals,
+                'Events': events[column],
+                'Non.Events': non_events[column],
+                'WOE': woe[column]
+            }))
+        self.bin_table_ = pd.concat(tables, ignore_index=True) if tables else \
+            pd.DataFrame(columns=['Variable', 'Bin', 'Events', 'Non.Events', 'WOE'])
+        return self
+
+
+def _numeric_matrix(df, target_column):
+    # Numeric predictor columns as one column-major float64 matrix; all-missing columns are left out
+    columns = []
+    matrix = np.empty((len(df), len(df.columns)), dtype=float, order='F')
+    for column in df.columns:
+        if column == target_column:
+            continue
+        values = _numeric_values(df[column])
+        if values is None:
+            print(f"Column '{column}' could not be converted to numeric type.")
+            continue
+        if np.isnan(values).all():
+            continue
+        matrix[:, len(columns)] = values
+        columns.append(column)
+    return columns, matrix[:, :len(columns)]
+
+
+def _numeric_values(series, errors='raise'):
+    # Values of a column as float64, or None when the column cannot be converted to numeric type
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    try:
+        return pd.to_numeric(series, errors=errors).to_numpy(dtype=float, na_value=np.nan)
+    except (ValueError, TypeError):
+        return None
@@ -0,0 +1,30 @@
+import numpy as np
+
+from creditpy import calculate_gini
+
+
+def _scores():
+    rng = np.random.default_rng(0)
+    actual = rng.integers(0, 2, 50000)
+    predictions = 1 / (1 + np.exp(-(actual + rng.standard_normal(len(actual)))))
+    return predictions, actual
+
+
+def test_histogram_method_returns_a_scalar_gini_like_the_exact_method():
+    predictions, actual = _scores()
+    exact = calculate_gini(predictions, actual)
+    histogram = calculate_gini(predictions, actual, method="histogram")
+
+    assert isinstance(exact, float)
+    assert isinstance(histogram, float)
+    assert abs(histogram - exact) < 1e-3
+
+
+def test_error_bound_is_returned_on_request():
+    predictions, actual = _scores()
+    exact = calculate_gini(predictions, actual)
+    gini, bound = calculate_gini(predictions, actual, method="histogram", return_error_bound=True)
+
+    assert bound > 0
+    assert abs(gini - exact) <= bound
+    assert calculate_gini(predictions, actual, return_error_bound=True) == (exact, 0.0)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from creditpy import PSI_calc_data, feature_screening
+
+
+def _samples(shift):
+    rng = np.random.default_rng(0)
+    n = 20000
+    main = pd.DataFrame({
+        'continuous': rng.standard_normal(n),
+        'category': rng.choice(['a', 'b', 'c'], n),
+        'flag': rng.integers(0, 2, n)
+    })
+    second = pd.DataFrame({
+        'continuous': rng.standard_normal(n) + shift,
+        'category': rng.choice(['a', 'b', 'c'], n),
+        'flag': rng.integers(0, 2, n)
+    })
+    return main, second
+
+
+def _psi(main, second, **options):
+    result = feature_screening(main, 'flag', [("psi", np.inf)], second_data=second, verbose=False, **options)
+    return result['summary'].set_index('Variable')['PSI']
+
+
+def test_psi_of_a_continuous_variable_uses_quantile_bins():
+    main, stable = _samples(0)
+    _, shifted = _samples(2)
+
+    assert _psi(main, stable)['continuous'] < 1
+    shifted_psi = _psi(main, shifted)['continuous']
+    assert shifted_psi > 100
+
+    # Same quantile edges with open outer bins as PSIBaseline
+    edges = np.quantile(main['continuous'], np.linspace(0, 1, 11))
+    expected = PSI_calc_data(main[['continuous']], shifted[['continuous']], {'continuous': edges}, 'flag')
+    assert abs(shifted_psi - expected['PSI'].iloc[0]) < 1e-9
+    assert abs(_psi(main, shifted, bins=10)['continuous'] - shifted_psi) < 1e-9
+
+
+def test_unseen_levels_are_counted_in_an_extra_bin():
+    main, second = _samples(0)
+    stable_psi = _psi(main, second)['category']
+    second.loc[second.index[:5000], 'category'] = 'new'
+
+    assert stable_psi < 1
+    assert _psi(main, second)['category'] > 50
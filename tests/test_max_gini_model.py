@@ -0,0 +1,76 @@
+import warnings
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+
+from creditpy import load_german_credit_data, max_gini_model
+
+
+@pytest.fixture(scope="module")
+def numeric_data():
+    data = load_german_credit_data()
+    columns = [column for column in data.columns
+               if pd.api.types.is_numeric_dtype(data[column]) and column != 'ID']
+    return data[columns]
+
+
+def _baseline_best_subset(data, default_flag):
+    # The original loop: every combination fitted from scratch, the first strictly better Gini wins
+    predictors = [column for column in data.columns if column != default_flag]
+    best_gini, best_subset = -1, None
+    for r in range(1, len(predictors) + 1):
+        for comb in combinations(predictors, r):
+            model = LogisticRegression().fit(data[list(comb)], data[default_flag])
+            gini = 2 * roc_auc_score(data[default_flag], model.predict_proba(data[list(comb)])[:, 1]) - 1
+            if gini > best_gini:
+                best_gini, best_subset = gini, comb
+    return best_gini, best_subset
+
+
+def test_exhaustive_search_matches_baseline_and_is_independent_of_n_jobs(numeric_data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        baseline_gini, baseline_subset = _baseline_best_subset(numeric_data, 'creditability')
+        serial = max_gini_model(numeric_data, 'creditability', top_k=600, verbose=False)
+        parallel = max_gini_model(numeric_data, 'creditability', top_k=600, n_jobs=2, backend="processes",
+                                  verbose=False)
+
+    assert list(serial['model'].feature_names_in_) == list(baseline_subset)
+    assert serial['leaderboard']['Gini'].iloc[0] == pytest.approx(baseline_gini, abs=1e-12)
+
+    serial_ginis = dict(zip(serial['leaderboard']['Variables'], serial['leaderboard']['Gini']))
+    parallel_ginis = dict(zip(parallel['leaderboard']['Variables'], parallel['leaderboard']['Gini']))
+    assert len(serial_ginis) == 2 ** (numeric_data.shape[1] - 1) - 1
+    assert serial_ginis.keys() == parallel_ginis.keys()
+    np.testing.assert_allclose([parallel_ginis[subset] for subset in serial_ginis], list(serial_ginis.values()),
+                               rtol=0, atol=1e-12)
+    assert list(parallel['model'].feature_names_in_) == list(baseline_subset)
+
+
+def test_warm_started_exhaustive_search_is_independent_of_n_jobs(numeric_data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        serial = max_gini_model(numeric_data, 'creditability', top_k=600, warm_start=True, verbose=False)
+        parallel = max_gini_model(numeric_data, 'creditability', top_k=600, warm_start=True, n_jobs=2,
+                                  backend="processes", verbose=False)
+
+    pd.testing.assert_frame_equal(serial['leaderboard'], parallel['leaderboard'])
+
+
+@pytest.mark.parametrize("max_variables", [2, None])
+def test_branch_and_bound_returns_the_best_subsets_of_the_exhaustive_search(numeric_data, max_variables):
+    predictors = [column for column in numeric_data.columns if column != 'creditability'][:6]
+    data = numeric_data[predictors + ['creditability']]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        exhaustive = max_gini_model(data, 'creditability', max_variables=max_variables, top_k=3, verbose=False)
+        bounded = max_gini_model(data, 'creditability', search="branch_and_bound", max_variables=max_variables,
+                                 top_k=3, verbose=False)
+
+    assert list(bounded['model'].feature_names_in_) == list(exhaustive['model'].feature_names_in_)
+    pd.testing.assert_frame_equal(bounded['leaderboard'].head(3).reset_index(drop=True),
+                                  exhaustive['leaderboard'].head(3).reset_index(drop=True))
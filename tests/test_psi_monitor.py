@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from creditpy import PSI_calc_data, PSIBaseline
+
+
+def _uniform_samples(current_high):
+    rng = np.random.default_rng(0)
+    main = pd.DataFrame({'x': rng.uniform(0, 1, 20000), 'flag': rng.integers(0, 2, 20000)})
+    current = pd.DataFrame({'x': rng.uniform(0, current_high, 20000), 'flag': rng.integers(0, 2, 20000)})
+    return main, current
+
+
+def test_values_beyond_the_baseline_range_are_counted_in_the_outer_bins():
+    main, current = _uniform_samples(3)
+    baseline = PSIBaseline.fit(main, bins=10, default_flag='flag')
+    counts = baseline.accumulator().update(current).counts['x']
+
+    assert counts.sum() == len(current)
+    assert counts[-1] / counts.sum() > 2 / 3
+
+
+def test_psi_of_shifted_current_data_reports_the_drift():
+    main, current = _uniform_samples(3)
+    stable, _ = _uniform_samples(1)
+    psi = PSI_calc_data(main, current, 10, 'flag')['PSI'].iloc[0]
+    stable_psi = PSI_calc_data(main, stable, 10, 'flag')['PSI'].iloc[0]
+
+    # Two thirds of the current mass lies above the baseline range and falls into the last bin
+    percentx = np.full(10, 0.1)
+    percenty = np.r_[np.full(9, 1 / 30), 1 / 30 + 2 / 3]
+    expected = np.sum((percentx - percenty) * np.log(percentx / percenty)) * 100
+    assert abs(psi - expected) < 5
+    assert psi > 100
+    assert stable_psi < 1
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from creditpy import variable_clustering
+from creditpy.variable_clustering import _variable_sketch
+
+
+def _grouped_data(n_rows, seed=0):
+    # Four groups of three variables, each variable a noisy copy of its group's factor
+    rng = np.random.default_rng(seed)
+    factors = rng.standard_normal((n_rows, 4)) * np.array([1, 4, 9, 16])
+    values = np.repeat(factors, 3, axis=1) + 0.1 * rng.standard_normal((n_rows, 12))
+    data = pd.DataFrame(values, columns=[f"v{i}" for i in range(12)])
+    data['flag'] = rng.integers(0, 2, n_rows)
+    return data
+
+
+def test_projection_sketch_bounds_the_chunk_memory_and_keeps_distances():
+    values = _grouped_data(30000).drop(columns=['flag']).to_numpy()
+    points = _variable_sketch(values, 256, "projection", seed=1, max_chunk_values=256 * 1000)
+
+    assert points.shape == (12, 256)
+    distances = np.linalg.norm(values[:, :, None] - values[:, None, :], axis=0)
+    sketched = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2)
+    upper = np.triu_indices(12, 1)
+    np.testing.assert_allclose(sketched[upper], distances[upper], rtol=0.3)
+
+
+def test_projection_sketch_on_more_rows_than_the_sample_size_finds_the_groups():
+    data = _grouped_data(30000)
+    clusters = variable_clustering(data, 'flag', sample_size=1000, sketch="projection", projection_size=128,
+                                   seed=0)
+
+    assert clusters['Group'].nunique() == 4
+    groups = clusters['Group'].to_numpy().reshape(4, 3)
+    assert all(len(set(group)) == 1 for group in groups)
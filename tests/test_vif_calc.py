@@ -0,0 +1,54 @@
+import inspect
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+from creditpy import load_german_credit_data, vif_calc, vif_elimination
+
+
+def _reference_vif(X):
+    # statsmodels' VIF on the raw columns, as in the pinned version 0.14
+    options = {'standardize': False} if 'standardize' in inspect.signature(variance_inflation_factor).parameters \
+        else {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return np.array([variance_inflation_factor(X.to_numpy(dtype=float), i, **options)
+                         for i in range(X.shape[1])])
+
+
+@pytest.fixture(scope="module")
+def numeric_data():
+    data = load_german_credit_data()
+    columns = [column for column in data.columns
+               if pd.api.types.is_numeric_dtype(data[column]) and column != 'creditability']
+    return data[columns].astype(float)
+
+
+def test_vif_matches_the_uncentred_statsmodels_definition(numeric_data):
+    vif = vif_calc(numeric_data, chunksize=300)
+    np.testing.assert_allclose(vif.to_numpy(), _reference_vif(numeric_data), rtol=1e-8)
+    assert vif['ID'] == pytest.approx(3.96, abs=0.01)
+
+
+def test_vif_with_a_constant_column_is_centred_for_the_other_columns(numeric_data):
+    X = numeric_data.assign(const=1.0)
+    np.testing.assert_allclose(vif_calc(X).to_numpy(), _reference_vif(X), rtol=1e-8)
+
+
+def test_singular_fallback_uses_the_same_definition(numeric_data):
+    X = numeric_data.assign(ID_copy=numeric_data['ID'] * 2, age_copy=numeric_data['age.in.years'] + 1)
+    vif = vif_calc(X)
+    regular = ['saving_ratio', 'duration.in.month', 'credit.amount']
+    np.testing.assert_allclose(vif[regular].to_numpy(), _reference_vif(X)[[X.columns.get_loc(c) for c in regular]],
+                               rtol=1e-6)
+    assert vif['ID'] > 1e8
+
+
+def test_vif_elimination_matches_recomputed_vifs(numeric_data):
+    result = vif_elimination(numeric_data, threshold=5, verbose=False)
+    remaining = result['remaining_variables']
+    np.testing.assert_allclose(result['vif'].to_numpy(), _reference_vif(numeric_data[remaining]), rtol=1e-8)
+    assert result['vif'].max() <= 5
@@ -0,0 +1,49 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+from creditpy import load_german_credit_data, walk_forward_validation_glm
+
+
+@pytest.fixture(scope="module")
+def vintage_data():
+    data = load_german_credit_data()
+    columns = [column for column in data.columns
+               if pd.api.types.is_numeric_dtype(data[column]) and column != 'ID']
+    data = data[columns].copy()
+    data['vintage'] = np.repeat(np.arange(8), len(data) // 8 + 1)[:len(data)]
+    return data
+
+
+@pytest.mark.parametrize("warm_start", [False, True])
+@pytest.mark.parametrize("window", ["expanding", "sliding"])
+def test_results_are_independent_of_n_jobs(vintage_data, warm_start, window):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        serial = walk_forward_validation_glm(vintage_data, 'creditability', 'vintage', window=window,
+                                             train_periods=2, warm_start=warm_start)
+        parallel = walk_forward_validation_glm(vintage_data, 'creditability', 'vintage', window=window,
+                                               train_periods=2, warm_start=warm_start, n_jobs=3,
+                                               backend="processes")
+
+    pd.testing.assert_frame_equal(serial.drop(columns='FitTime'), parallel.drop(columns='FitTime'))
+
+
+def test_average_row_keeps_integer_counts_and_pools_the_binomial_test(vintage_data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = walk_forward_validation_glm(vintage_data, 'creditability', 'vintage', train_periods=2)
+
+    assert pd.api.types.is_integer_dtype(result['Train.Count'])
+    assert pd.api.types.is_integer_dtype(result['Test.Count'])
+
+    periods, average = result.iloc[:-1], result.iloc[-1]
+    assert average['Test.Period'] == 'Average'
+    expected = periods['Mean.PD'] * periods['Test.Count']
+    observed = periods['Default.Rate'] * periods['Test.Count']
+    z = (observed - expected).sum() / np.sqrt((expected * (1 - periods['Mean.PD'])).sum())
+    assert average['Binomial.Z'] == pytest.approx(z)
+    assert average['Binomial.P.Value'] == pytest.approx(2 * norm.sf(abs(z)))
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from creditpy import StatsCache, WoeTransformer, load_german_credit_data, woe_binning
+
+
+def _numeric_german_data():
+    data = load_german_credit_data()
+    columns = [column for column in data.columns
+               if pd.api.types.is_numeric_dtype(data[column]) and column != 'ID']
+    return data[columns]
+
+
+def test_from_counts_rebuilds_a_fitted_transformer():
+    data = _numeric_german_data()
+    fitted = WoeTransformer(bins=5).fit(data, 'creditability')
+    table = fitted.bin_table_
+    edges = {column: fitted.edges_[fitted.edge_offsets_[j]:fitted.edge_offsets_[j + 1]]
+             for j, column in enumerate(fitted.columns_)}
+    events = {column: table.loc[table['Variable'] == column, 'Events'].to_numpy() for column in edges}
+    non_events = {column: table.loc[table['Variable'] == column, 'Non.Events'].to_numpy() for column in edges}
+
+    rebuilt = WoeTransformer.from_counts('creditability', edges, events, non_events, bins=5)
+
+    assert rebuilt.columns_ == fitted.columns_
+    pd.testing.assert_frame_equal(rebuilt.transform(data), fitted.transform(data))
+
+
+def test_cached_woe_binning_matches_the_uncached_one():
+    data = _numeric_german_data()
+    train, test = data.iloc[:700], data.iloc[700:]
+    cache = StatsCache()
+    expected = woe_binning(train, test, 'creditability')
+    for _ in range(2):
+        result = woe_binning(train, test, 'creditability', cache=cache)
+        for frame, expected_frame in zip(result, expected):
+            pd.testing.assert_frame_equal(frame, expected_frame)
+    assert cache.stats()['hits'] == np.sum([column != 'creditability' for column in data.columns])